@@ -3,7 +3,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -32,6 +32,17 @@ class Detection:
     timestamp: float = 0.0
 
 
+@dataclass(slots=True)
+class YOLODetection:
+    """Tracked person detection published by the YOLO plugin as "yolo_detections"."""
+
+    bbox: Tuple[int, int, int, int]  # (x1, y1, x2, y2) in display pixels
+    track_id: int
+    confidence: float
+    identity: str  # "FRIEND" or "FOE"
+    has_mask: bool = False
+
+
 class FriendlyUnitStatus(Enum):
     """Team member status types."""
 
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
@@ -23,6 +24,12 @@ class PluginPosition(Enum):
     CUSTOM = "custom"
 
 
+@lru_cache(maxsize=512)
+def text_size(text: str, font_scale: float, thickness: int, font: int = cv2.FONT_HERSHEY_SIMPLEX) -> Tuple[int, int]:
+    """Cached cv2.getTextSize width/height; HUD labels repeat every frame, so measure each one once."""
+    return cv2.getTextSize(text, font, font_scale, thickness)[0]
+
+
 @dataclass
 class PluginMetadata:
     name: str
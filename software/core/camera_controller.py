@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Thread-safe camera controller wrapper for OpenCV VideoCapture."""
 
+import logging
 import threading
 from typing import Any, Dict, Optional, Tuple
 
 import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 class CameraController:
@@ -46,7 +50,14 @@ class CameraController:
             raise ValueError("VideoCapture is not opened")
 
         self._capture = capture
+        # _lock guards property access and the pending queue; _read_lock serialises reads and release
         self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._reading = False
+        self._pending_properties: Dict[int, float] = {}
+
+        # Only a real VideoCapture can decode into a caller-provided array
+        self._reuse_buffers = isinstance(capture, cv2.VideoCapture)
 
     def set_exposure(self, value: float) -> bool:
         if self._capture is None:
@@ -54,15 +65,12 @@ class CameraController:
         if not self.EXPOSURE_MIN <= value <= self.EXPOSURE_MAX:
             return False
 
-        with self._lock:
-            return self._capture.set(cv2.CAP_PROP_EXPOSURE, value)
+        return self._set_capture_property(cv2.CAP_PROP_EXPOSURE, value)
 
     def get_exposure(self) -> Optional[float]:
         if self._capture is None:
             raise RuntimeError("Camera has been released")
-        with self._lock:
-            value = self._capture.get(cv2.CAP_PROP_EXPOSURE)
-            return value if value != -1 else None
+        return self._get_capture_property(cv2.CAP_PROP_EXPOSURE)
 
     def set_gain(self, value: float) -> bool:
         if self._capture is None:
@@ -70,15 +78,12 @@ class CameraController:
         if not self.GAIN_MIN <= value <= self.GAIN_MAX:
             return False
 
-        with self._lock:
-            return self._capture.set(cv2.CAP_PROP_GAIN, value)
+        return self._set_capture_property(cv2.CAP_PROP_GAIN, value)
 
     def get_gain(self) -> Optional[float]:
         if self._capture is None:
             raise RuntimeError("Camera has been released")
-        with self._lock:
-            value = self._capture.get(cv2.CAP_PROP_GAIN)
-            return value if value != -1 else None
+        return self._get_capture_property(cv2.CAP_PROP_GAIN)
 
     def set_brightness(self, value: float) -> bool:
         if self._capture is None:
@@ -86,15 +91,12 @@ class CameraController:
         if not self.BRIGHTNESS_MIN <= value <= self.BRIGHTNESS_MAX:
             return False
 
-        with self._lock:
-            return self._capture.set(cv2.CAP_PROP_BRIGHTNESS, value)
+        return self._set_capture_property(cv2.CAP_PROP_BRIGHTNESS, value)
 
     def get_brightness(self) -> Optional[float]:
         if self._capture is None:
             raise RuntimeError("Camera has been released")
-        with self._lock:
-            value = self._capture.get(cv2.CAP_PROP_BRIGHTNESS)
-            return value if value != -1 else None
+        return self._get_capture_property(cv2.CAP_PROP_BRIGHTNESS)
 
     def set_property(self, prop_id: int, value: float) -> bool:
         if self._capture is None:
@@ -107,8 +109,7 @@ class CameraController:
             if not min_val <= value <= max_val:
                 return False
 
-        with self._lock:
-            return self._capture.set(prop_id, value)
+        return self._set_capture_property(prop_id, value)
 
     def get_property(self, prop_id: int) -> Optional[float]:
         if self._capture is None:
@@ -116,18 +117,59 @@ class CameraController:
         if prop_id not in self.WHITELISTED_PROPERTIES:
             return None
 
+        return self._get_capture_property(prop_id)
+
+    def _set_capture_property(self, prop_id: int, value: float) -> bool:
+        """Apply a property, or queue it while a read is in flight.
+
+        A queued change returns True before the camera has seen it; if the deferred set is rejected it is
+        logged, and getters report the queued value until then.
+        """
+        with self._lock:
+            if self._reading:
+                # Don't wait out a blocking read; the reading thread applies this as soon as read() returns
+                self._pending_properties[prop_id] = value
+                return True
+            return self._capture.set(prop_id, value)
+
+    def _get_capture_property(self, prop_id: int) -> Optional[float]:
         with self._lock:
+            if prop_id in self._pending_properties:
+                return self._pending_properties[prop_id]
             value = self._capture.get(prop_id)
             return value if value != -1 else None
 
+    def _apply_pending_properties(self):
+        for prop_id, value in self._pending_properties.items():
+            if not self._capture.set(prop_id, value):
+                logger.warning(f"Camera rejected deferred property {prop_id} = {value}")
+        self._pending_properties.clear()
+
     def read_frame(self) -> Tuple[bool, Optional[Any]]:
-        if self._capture is None:
-            raise RuntimeError("Camera has been released")
-        with self._lock:
-            return self._capture.read()
+        return self.read_frame_into(None)
+
+    def read_frame_into(self, out: Optional[np.ndarray]) -> Tuple[bool, Optional[Any]]:
+        """Read into a caller-owned buffer so capture does not allocate a new array per frame (fresh when None)."""
+        with self._read_lock:
+            with self._lock:
+                if self._capture is None:
+                    raise RuntimeError("Camera has been released")
+                capture = self._capture
+                self._reading = True
+
+            # Read without holding _lock so property changes from the render thread never wait on the camera
+            try:
+                if self._reuse_buffers and out is not None:
+                    return capture.read(out)
+                return capture.read()
+            finally:
+                with self._lock:
+                    self._reading = False
+                    self._apply_pending_properties()
 
     def release(self):
-        with self._lock:
+        with self._read_lock, self._lock:
+            self._pending_properties.clear()
             if self._capture is not None:
                 self._capture.release()
                 self._capture = None
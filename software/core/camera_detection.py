@@ -173,19 +173,31 @@ def _init_opencv_camera(camera_num: int, width: int, height: int):
         if not cap.isOpened():
             raise RuntimeError(f"Could not open camera {camera_num}")
 
-    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"BGR3"))
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-    cap.set(cv2.CAP_PROP_FPS, 30)
+    _set_capture_property(cap, cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"BGR3"))
+    _set_capture_property(cap, cv2.CAP_PROP_FRAME_WIDTH, width)
+    _set_capture_property(cap, cv2.CAP_PROP_FRAME_HEIGHT, height)
+    _set_capture_property(cap, cv2.CAP_PROP_BUFFERSIZE, 1)
+    _set_capture_property(cap, cv2.CAP_PROP_FPS, 30)
 
     ret, test_frame = cap.read()
     if not ret or test_frame is None:
         logger.debug("BGR3 failed, trying YUYV format...")
-        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"YUYV"))
+        _set_capture_property(cap, cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"YUYV"))
         ret, test_frame = cap.read()
         if not ret or test_frame is None:
             cap.release()
             raise RuntimeError("Camera opened but failed to read frames")
 
+    frame_height, frame_width = test_frame.shape[:2]
+    if (frame_width, frame_height) != (width, height):
+        logger.warning(
+            f"Camera {camera_num} does not support {width}x{height}, delivering {frame_width}x{frame_height} instead"
+        )
+
     return cap
+
+
+def _set_capture_property(cap, prop: int, value: float):
+    # On V4L2 each accepted set can restart the stream, so skip values the device already has
+    if cap.get(prop) != value:
+        cap.set(prop, value)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""HighGUI window output on its own thread so imshow and key polling overlap the next frame's render."""
+
+import logging
+import platform
+import queue
+import threading
+from typing import Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NO_KEY = -1  # What cv2.pollKey() returns when nothing was pressed
+
+# HighGUI backends (as named by cv2.currentUIFramework()) that must stay on the main thread
+MAIN_THREAD_UI_FRAMEWORKS = ("QT", "COCOA")
+
+
+def poll_window_key() -> int:
+    """Return the pending HighGUI key press without waiting, or NO_KEY."""
+    key = cv2.pollKey()
+    # Mask to the low byte like the old waitKey(1) & 0xFF, but only for real presses so 0xFF is not "no key"
+    return key if key == NO_KEY else key & 0xFF
+
+
+class DisplayThread:
+    """Owns the OpenCV window: shows submitted frames and polls for keys, queueing any presses.
+
+    Frames go through a single slot that the render loop copies into; a frame submitted while the previous
+    one is still being shown is dropped. All HighGUI calls, including window teardown, happen on this thread.
+    """
+
+    FRAME_WAIT = 0.005
+    JOIN_TIMEOUT = 2.0
+
+    def __init__(self, window_name: str):
+        self.window_name = window_name
+
+        self._frame: Optional[np.ndarray] = None
+        self._frame_ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._keys: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        # Cocoa and Qt only let HighGUI windows run from the main thread
+        if platform.system() == "Darwin":
+            return False
+        ui_framework = cv2.currentUIFramework() if hasattr(cv2, "currentUIFramework") else ""
+        return not ui_framework.upper().startswith(MAIN_THREAD_UI_FRAMEWORKS)
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._display_loop, name="display", daemon=True)
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _display_loop(self):
+        try:
+            while not self._stop_event.is_set():
+                if self._frame_ready.wait(self.FRAME_WAIT):
+                    cv2.imshow(self.window_name, self._frame)
+                    # Only release the slot once imshow is done reading it
+                    self._frame_ready.clear()
+
+                # Keep pumping window events between frames so key presses are not missed
+                key = poll_window_key()
+                if key != NO_KEY:
+                    self._keys.put(key)
+        except cv2.error as e:
+            logger.error(f"Display thread error: {e}")
+        finally:
+            cv2.destroyAllWindows()
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """Copy a frame into the display slot; skipped while the previous frame is still being shown."""
+        if self._frame_ready.is_set():
+            return False
+
+        if self._frame is None or self._frame.shape != frame.shape:
+            self._frame = np.empty_like(frame)
+        np.copyto(self._frame, frame)
+        self._frame_ready.set()
+        return True
+
+    def poll_key(self) -> int:
+        """Return the oldest unhandled key press without blocking, or NO_KEY."""
+        try:
+            return self._keys.get_nowait()
+        except queue.Empty:
+            return NO_KEY
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.JOIN_TIMEOUT)
+            self._thread = None
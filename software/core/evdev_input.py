@@ -149,17 +149,41 @@ class EvdevKeyboard:
             if not r:
                 return None  # No input available
 
+        except Exception as e:
+            logger.error(f"Error reading keyboard: {e}")
+            return None
+
+        return self.read_key_nonblocking()
+
+    def read_key_nonblocking(self) -> Optional[int]:
+        """Read a key press from already-pending events without waiting.
+
+        Intended for callers that poll fileno() themselves (e.g. with epoll).
+
+        Returns:
+            ASCII key code (compatible with cv2.waitKey), or None if no key pressed
+        """
+        if not self.device:
+            return None
+
+        try:
             # Read all pending events
             for event in self.device.read():
                 # We only care about key press events (not release)
                 if event.type == self.ecodes.EV_KEY and event.value == 1:  # 1 = key down
                     return self._evdev_to_ascii(event.code)
 
+        except BlockingIOError:
+            pass  # No events pending
         except Exception as e:
             logger.error(f"Error reading keyboard: {e}")
 
         return None
 
+    def fileno(self) -> int:
+        """Return the event device file descriptor for select/epoll."""
+        return self.device.fd
+
     def read_key_blocking(self) -> int:
         """Read a key press (blocking until key is pressed).
 
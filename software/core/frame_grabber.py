@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Background camera capture so frame I/O overlaps plugin update/render."""
+
+import logging
+import threading
+from typing import List, Optional
+
+import numpy as np
+from core.camera_controller import CameraController
+
+logger = logging.getLogger(__name__)
+
+
+class FrameGrabber:
+    """Reads frames from a CameraController on its own thread and hands the newest one to the render loop.
+
+    Triple-buffered: the grabber always decodes into a buffer that is neither the newest unread frame nor
+    the frame the consumer is currently drawing on, so plugins can render in place without tearing.
+    Frames the consumer is too slow to take are dropped rather than queued.
+    """
+
+    BUFFER_COUNT = 3
+    JOIN_TIMEOUT = 2.0
+
+    def __init__(self, camera: CameraController):
+        self.camera = camera
+
+        self._buffers: List[Optional[np.ndarray]] = [None] * self.BUFFER_COUNT
+        self._pending: Optional[int] = None
+        self._held: Optional[int] = None
+        self._finished = False
+        self._ready = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop_event.clear()
+        self._finished = False
+        self._thread = threading.Thread(target=self._capture_loop, name="frame-grabber", daemon=True)
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _capture_loop(self):
+        while not self._stop_event.is_set():
+            with self._ready:
+                index = next(i for i in range(self.BUFFER_COUNT) if i != self._pending and i != self._held)
+
+            try:
+                ret, frame = self.camera.read_frame_into(self._buffers[index])
+            except RuntimeError:
+                break  # Camera released underneath us during shutdown
+
+            if not ret or frame is None:
+                logger.error("Camera read failed, stopping frame grabber")
+                break
+
+            with self._ready:
+                self._buffers[index] = frame
+                self._pending = index
+                self._ready.notify()
+
+        with self._ready:
+            self._finished = True
+            self._ready.notify_all()
+
+    def get_latest(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return the newest unread frame, waiting up to timeout; None on timeout or once capture has stopped.
+
+        The returned array stays valid until the next call.
+        """
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._pending is not None or self._finished, timeout):
+                return None
+            if self._pending is None:
+                return None
+
+            self._held = self._pending
+            self._pending = None
+            return self._buffers[self._held]
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.JOIN_TIMEOUT)
+            self._thread = None
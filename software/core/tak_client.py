@@ -4,7 +4,6 @@
 import logging
 import socket
 import threading
-import time
 import uuid
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
@@ -57,6 +56,7 @@ class TAKClient:
 
         self.send_thread = None
         self.recv_thread = None
+        self._stop_event = threading.Event()
 
     def connect(self) -> bool:
         """Connect to TAK server.
@@ -73,6 +73,7 @@ class TAKClient:
             logger.info(f"Connected to TAK server as {self.callsign}")
 
             self.running = True
+            self._stop_event.clear()
             self.send_thread = threading.Thread(target=self._position_send_loop, daemon=True)
             self.send_thread.start()
 
@@ -90,6 +91,7 @@ class TAKClient:
         """Disconnect from TAK server."""
         self.running = False
         self.connected = False
+        self._stop_event.set()
 
         if self.socket:
             try:
@@ -191,7 +193,8 @@ class TAKClient:
             except Exception as e:
                 logger.error(f"Error sending position update: {e}")
 
-            time.sleep(self.POSITION_UPDATE_INTERVAL)
+            # Wake immediately on disconnect instead of sleeping out the interval past the join timeout
+            self._stop_event.wait(self.POSITION_UPDATE_INTERVAL)
 
     def _message_recv_loop(self):
         """Background thread that receives CoT messages from TAK server."""
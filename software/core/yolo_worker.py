@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Out-of-process YOLO inference with a shared-memory frame handoff."""
+
+import logging
+import multiprocessing as mp
+import os
+import queue
+import sys
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (xyxy, track_ids, confidences, mask outlines) as plain numpy arrays so they pickle cheaply between processes;
+# each outline is an (N, 2) float32 polygon in input-frame pixels rather than a full-resolution float mask
+Detections = Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[List[np.ndarray]]]
+
+# Cores left free for the camera/render loop so Torch's pool does not contend with OpenCV
+RESERVED_CORES = 2
+INTEROP_THREADS = 2
+COMPILE_WARMUP_ITERATIONS = 3
+
+# Values of the worker's shared load-status flag
+MODEL_LOADING = 0
+MODEL_READY = 1
+MODEL_FAILED = -1
+
+
+def select_device() -> str:
+    """Return "cuda" when PyTorch can see a GPU, otherwise "cpu"."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def configure_torch_threads():
+    try:
+        import torch
+    except ImportError:
+        return
+
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) - RESERVED_CORES))
+    try:
+        torch.set_num_interop_threads(INTEROP_THREADS)
+    except RuntimeError:
+        pass  # Can only be set before the first parallel op in this process
+    torch.set_float32_matmul_precision("high")
+
+
+def load_model(model_path: str, device: str = "cpu", compile_model: bool = False, imgsz: int = 640):
+    from ultralytics import YOLO
+
+    configure_torch_threads()
+    model = YOLO(model_path)
+    # Exported ONNX/OpenVINO models pick their device at predict time
+    if model_path.endswith(".pt"):
+        model.to(device)
+        if compile_model:
+            _compile_model(model, device, imgsz)
+    return model
+
+
+def _compile_model(model, device: str, imgsz: int):
+    """Wrap the underlying nn.Module with torch.compile and warm it up, falling back to eager on failure."""
+    import torch
+
+    if not hasattr(torch, "compile"):
+        logger.warning("torch.compile requires PyTorch 2.0+, running YOLO eagerly")
+        return
+
+    eager_module = model.model
+    try:
+        if device == "cuda":
+            model.model = model.model.to(memory_format=torch.channels_last)
+        model.model = torch.compile(model.model, mode="reduce-overhead")
+
+        # Pay the compile cost here rather than on the first live frame
+        warmup_frame = np.zeros((imgsz, imgsz, 3), dtype=np.uint8)
+        for _ in range(COMPILE_WARMUP_ITERATIONS):
+            model.predict(warmup_frame, imgsz=imgsz, device=device, verbose=False)
+        logger.info("YOLO model compiled with torch.compile")
+    except Exception as e:
+        logger.warning(f"torch.compile failed, running YOLO eagerly: {e}")
+        model.model = eager_module
+
+
+def extract_detections(results) -> Optional[Detections]:
+    """Copy tracked boxes (and mask outlines) out of Ultralytics results, or None if nothing is tracked.
+
+    Confidence filtering happens inside the model via track(conf=...), so every box here is kept.
+    """
+    result = results[0]
+    boxes = result.boxes
+    if boxes.id is None:
+        return None
+
+    # Move everything across in one transfer; with tracking enabled, rows are [x1, y1, x2, y2, track_id, conf, cls]
+    data = boxes.data.cpu().numpy()
+
+    masks = getattr(result, "masks", None)
+    outlines = list(masks.xy) if masks is not None else None
+
+    return data[:, :4], data[:, 4].astype(np.int32), data[:, 5], outlines
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    # The parent owns the block; keep the child from registering it with the resource tracker
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _inference_main(
+    model_path, shm_name, frame_shape, track_kwargs, compile_model, frame_ready, stop_event, sequence, results, status
+):
+    try:
+        model = load_model(model_path, track_kwargs.get("device", "cpu"), compile_model, track_kwargs.get("imgsz", 640))
+    except Exception as e:
+        logger.error(f"YOLO worker failed to load {model_path}: {e}")
+        status.value = MODEL_FAILED
+        return
+    status.value = MODEL_READY
+
+    shm = _attach_shared_memory(shm_name)
+    shared_frame = np.ndarray(frame_shape, dtype=np.uint8, buffer=shm.buf)
+    frame = np.empty(frame_shape, dtype=np.uint8)
+
+    try:
+        while not stop_event.is_set():
+            if not frame_ready.wait(YOLOInferenceWorker.POLL_TIMEOUT):
+                continue
+
+            # Take a private copy before releasing the slot so the producer can refill it during inference
+            np.copyto(frame, shared_frame)
+            frame_sequence = sequence.value
+            frame_ready.clear()
+
+            try:
+                detections = extract_detections(model.track(frame, **track_kwargs))
+                results.put((frame_sequence, detections))
+            except Exception as e:
+                logger.error(f"YOLO worker inference error: {e}")
+    finally:
+        del shared_frame
+        shm.close()
+
+
+class YOLOInferenceWorker:
+    """Runs YOLO tracking in its own process so inference never blocks the render loop.
+
+    Frames are written into a single shared-memory slot; the worker signals it has taken a frame by
+    clearing ``frame_ready``, and posts detections back through a queue tagged with the frame sequence.
+    Whether the model loaded is reported through a shared status flag so the owner can notice a dead worker.
+    """
+
+    POLL_TIMEOUT = 0.1
+    JOIN_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        model_path: str,
+        frame_shape: Tuple[int, ...],
+        track_kwargs: Dict[str, Any],
+        compile_model: bool = False,
+    ):
+        self.model_path = model_path
+        self.frame_shape = tuple(frame_shape)
+        self.track_kwargs = track_kwargs
+        self.compile_model = compile_model
+
+        # spawn avoids forking the parent's camera, display and OpenCV thread state
+        self._ctx = mp.get_context("spawn")
+        self._frame_ready = self._ctx.Event()
+        self._stop_event = self._ctx.Event()
+        self._sequence = self._ctx.Value("Q", 0, lock=False)
+        self._status = self._ctx.Value("b", MODEL_LOADING, lock=False)
+        self._results = self._ctx.Queue()
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._frame: Optional[np.ndarray] = None
+        self._process = None
+
+        self.last_sequence = 0
+        self.last_detections: Optional[Detections] = None
+
+    def start(self):
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(self.frame_shape)))
+        self._frame = np.ndarray(self.frame_shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._process = self._ctx.Process(
+            target=_inference_main,
+            args=(
+                self.model_path,
+                self._shm.name,
+                self.frame_shape,
+                self.track_kwargs,
+                self.compile_model,
+                self._frame_ready,
+                self._stop_event,
+                self._sequence,
+                self._results,
+                self._status,
+            ),
+            name="yolo-inference",
+            daemon=True,
+        )
+        self._process.start()
+        logger.info(f"YOLO inference process started (pid {self._process.pid})")
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def has_failed(self) -> bool:
+        """True once the model failed to load or the process has exited; it will never post results again."""
+        return self._status.value == MODEL_FAILED or (self._process is not None and not self._process.is_alive())
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """Copy a frame into the shared slot; skipped while the worker has not taken the previous one."""
+        if self._frame is None or self._frame_ready.is_set():
+            return False
+
+        np.copyto(self._frame, frame)
+        self._sequence.value += 1
+        self._frame_ready.set()
+        return True
+
+    def latest(self) -> Optional[Detections]:
+        """Return the newest finished detections without blocking, or the previous ones if none are ready."""
+        try:
+            while True:
+                self.last_sequence, self.last_detections = self._results.get_nowait()
+        except queue.Empty:
+            pass
+        return self.last_detections
+
+    def stop(self):
+        self._stop_event.set()
+        if self._process is not None:
+            self._process.join(timeout=self.JOIN_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+        self._results.close()
+        self._frame = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
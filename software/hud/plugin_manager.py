@@ -3,24 +3,58 @@
 import importlib
 import importlib.util
 import inspect
+import json
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Collection, Dict, List, Optional, Type
 
 import numpy as np
 from common.plugin_base import HUDContext, HUDPlugin, PluginConfig, PluginMetadata
 
 
 class PluginManager:
+    DISCOVERY_CACHE_VERSION = 1
+
     def __init__(self, context: HUDContext, plugin_dir: str = "hud/plugins"):
         self.context = context
         self.plugin_dir = Path(plugin_dir)
         self.plugins: List[HUDPlugin] = []
+        self._provides_index: Dict[str, List[str]] = {}
         self.plugin_classes: Dict[str, Type[HUDPlugin]] = {}
         self.plugin_modules: Dict[str, Any] = {}
         self.plugin_file_times: Dict[str, float] = {}
         self.last_update_time = time.time()
+        # Bumped whenever the plugin list or a plugin's enabled/visible state may have changed
+        self.version = 0
+        # Plugins sorted by z_index, re-sorted only when the version moves
+        self._render_order: List[HUDPlugin] = []
+        self._render_order_version: Optional[int] = None
+
+    @property
+    def plugin_classes(self) -> Dict[str, Type[HUDPlugin]]:
+        return self._plugin_classes
+
+    @plugin_classes.setter
+    def plugin_classes(self, plugin_classes: Dict[str, Type[HUDPlugin]]):
+        self._plugin_classes = plugin_classes
+        self._rebuild_provides_index()
+
+    def _register_plugin_class(self, name: str, plugin_class: Type[HUDPlugin]):
+        self._plugin_classes[name] = plugin_class
+        self._rebuild_provides_index()
+
+    def _rebuild_provides_index(self):
+        """Map each provided data key to the plugin classes that provide it, for soft-dependency lookups."""
+        index: Dict[str, List[str]] = {}
+        for name, plugin_class in self._plugin_classes.items():
+            try:
+                provided_keys = self._get_metadata(plugin_class).provides or []
+            except Exception:
+                continue
+            for key in provided_keys:
+                index.setdefault(key, []).append(name)
+        self._provides_index = index
 
     def _get_metadata(self, plugin_class: Type[HUDPlugin]) -> PluginMetadata:
         """Get metadata from plugin class without instantiation."""
@@ -28,7 +62,19 @@ class PluginManager:
             raise AttributeError(f"{plugin_class.__name__} must define METADATA as a class-level attribute")
         return plugin_class.METADATA
 
-    def discover_plugins(self) -> Dict[str, Type[HUDPlugin]]:
+    def discover_plugins(
+        self,
+        cache_path: Optional[Path] = None,
+        names: Optional[Collection[str]] = None,
+        force_refresh: bool = False,
+    ) -> Dict[str, Type[HUDPlugin]]:
+        """Import plugin modules and collect their HUDPlugin classes.
+
+        With a cache_path and the plugin class names that are actually wanted, a discovery cache whose
+        file mtimes still match lets us import only the modules defining those classes. Any miss falls
+        back to a full scan, which rewrites the cache. Either way only the wanted classes are registered,
+        so soft dependencies are inferred from the same plugin set whether or not the cache was used.
+        """
         discovered = {}
 
         if not self.plugin_dir.exists():
@@ -39,28 +85,80 @@ class PluginManager:
         if str(plugin_parent) not in sys.path:
             sys.path.insert(0, str(plugin_parent))
 
-        for plugin_file in self.plugin_dir.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue
+        plugin_files = sorted(f for f in self.plugin_dir.glob("*.py") if not f.name.startswith("_"))
+        file_times = {f.stem: f.stat().st_mtime_ns for f in plugin_files}
 
-            try:
-                module_name = f"hud.plugins.{plugin_file.stem}"
-                module = importlib.import_module(module_name)
+        cached = None
+        if cache_path is not None and names is not None and not force_refresh:
+            cached = self._load_discovery_cache(cache_path, file_times)
+            if cached is not None and not all(name in cached for name in names):
+                cached = None
 
-                self.plugin_modules[plugin_file.stem] = module
-                self.plugin_file_times[plugin_file.stem] = plugin_file.stat().st_mtime
+        if cached is not None:
+            wanted_stems = {cached[name] for name in names}
+            plugin_files = [f for f in plugin_files if f.stem in wanted_stems]
 
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if issubclass(obj, HUDPlugin) and obj is not HUDPlugin and obj.__module__ == module_name:
-                        discovered[name] = obj
-                        print(f"Discovered plugin: {name} from {plugin_file.name}")
+        for plugin_file in plugin_files:
+            discovered.update(self._import_plugin_module(plugin_file))
 
-            except Exception as e:
-                print(f"Error loading plugin {plugin_file.name}: {e}")
+        if cache_path is not None and cached is None:
+            self._save_discovery_cache(cache_path, file_times, discovered)
+
+        if names is not None:
+            discovered = {name: discovered[name] for name in names if name in discovered}
+            wanted_stems = {cls.__module__.rsplit(".", 1)[-1] for cls in discovered.values()}
+            for stem in file_times.keys() - wanted_stems:
+                self.plugin_modules.pop(stem, None)
+                self.plugin_file_times.pop(stem, None)
 
         self.plugin_classes = discovered
         return discovered
 
+    def _import_plugin_module(self, plugin_file: Path) -> Dict[str, Type[HUDPlugin]]:
+        discovered = {}
+        try:
+            module_name = f"hud.plugins.{plugin_file.stem}"
+            module = importlib.import_module(module_name)
+
+            self.plugin_modules[plugin_file.stem] = module
+            self.plugin_file_times[plugin_file.stem] = plugin_file.stat().st_mtime
+
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                if issubclass(obj, HUDPlugin) and obj is not HUDPlugin and obj.__module__ == module_name:
+                    discovered[name] = obj
+                    print(f"Discovered plugin: {name} from {plugin_file.name}")
+
+        except Exception as e:
+            print(f"Error loading plugin {plugin_file.name}: {e}")
+
+        return discovered
+
+    def _load_discovery_cache(self, cache_path: Path, file_times: Dict[str, int]) -> Optional[Dict[str, str]]:
+        """Return the cached class name → module stem map, or None if missing or any plugin file changed."""
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("version") != self.DISCOVERY_CACHE_VERSION or cache.get("files") != file_times:
+            return None
+        return cache.get("plugins")
+
+    def _save_discovery_cache(
+        self, cache_path: Path, file_times: Dict[str, int], discovered: Dict[str, Type[HUDPlugin]]
+    ):
+        cache = {
+            "version": self.DISCOVERY_CACHE_VERSION,
+            "files": file_times,
+            "plugins": {name: cls.__module__.rsplit(".", 1)[-1] for name, cls in discovered.items()},
+        }
+        try:
+            with open(cache_path, "w") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not write plugin discovery cache {cache_path}: {e}")
+
     def check_dependencies(self, plugin_class: Type[HUDPlugin]) -> tuple[bool, List[str]]:
         try:
             metadata = self._get_metadata(plugin_class)
@@ -93,17 +191,10 @@ class PluginManager:
             data_keys_consumed = getattr(metadata, "consumes", [])
 
             inferred_deps = []
-            for other_name, other_class in self.plugin_classes.items():
-                if other_name == plugin_name:
-                    continue
-                try:
-                    other_metadata = self._get_metadata(other_class)
-                    provided_keys = other_metadata.provides or []
-
-                    if any(key in provided_keys for key in data_keys_consumed):
-                        inferred_deps.append(other_name)
-                except Exception:
-                    continue
+            for key in data_keys_consumed:
+                for provider_name in self._provides_index.get(key, ()):
+                    if provider_name != plugin_name:
+                        inferred_deps.append(provider_name)
 
             all_deps = list(set(declared_deps + inferred_deps))
             return all_deps
@@ -157,6 +248,7 @@ class PluginManager:
             if plugin.initialize():
                 plugin.initialized = True
                 self.plugins.append(plugin)
+                self.version += 1
 
                 if plugin.metadata.provides:
                     provides_str = ", ".join(plugin.metadata.provides)
@@ -188,6 +280,7 @@ class PluginManager:
         try:
             plugin.cleanup()
             self.plugins.remove(plugin)
+            self.version += 1
             print(f"Unloaded plugin: {plugin.metadata.name}")
         except Exception as e:
             print(f"Error unloading plugin {plugin.metadata.name}: {e}")
@@ -215,11 +308,14 @@ class PluginManager:
         self.context.clear_events()
 
     def render(self, frame: np.ndarray) -> np.ndarray:
-        sorted_plugins = sorted(
-            [p for p in self.plugins if p.visible and p.metadata.enabled], key=lambda p: p.config.z_index
-        )
+        if self._render_order_version != self.version:
+            # sorted() is stable, so plugins with equal z_index still render in load order
+            self._render_order = sorted(self.plugins, key=lambda p: p.config.z_index)
+            self._render_order_version = self.version
 
-        for plugin in sorted_plugins:
+        for plugin in self._render_order:
+            if not (plugin.visible and plugin.metadata.enabled):
+                continue
             try:
                 frame = plugin.render(frame)
             except Exception as e:
@@ -236,6 +332,9 @@ class PluginManager:
                         handled = True
                 except Exception as e:
                     print(f"Error handling key in {plugin.metadata.name}: {e}")
+        if handled:
+            # Handled keys are how plugins get toggled at runtime
+            self.version += 1
         return handled
 
     def cleanup(self):
@@ -296,11 +395,12 @@ class PluginManager:
 
             for name, obj in inspect.getmembers(module, inspect.isclass):
                 if issubclass(obj, HUDPlugin) and obj is not HUDPlugin and name == plugin_name:
-                    self.plugin_classes[name] = obj
+                    self._register_plugin_class(name, obj)
 
                     new_plugin = self.load_plugin(obj, saved_config)
                     if new_plugin:
                         new_plugin.visible = saved_visible
+                        self.version += 1
                         print(f"✓ Reloaded plugin: {plugin_name}")
                         return True
 
@@ -363,7 +463,7 @@ class PluginManager:
 
                 for name, obj in inspect.getmembers(module, inspect.isclass):
                     if issubclass(obj, HUDPlugin) and obj is not HUDPlugin and obj.__module__ == module_name:
-                        self.plugin_classes[name] = obj
+                        self._register_plugin_class(name, obj)
 
                         plugin = self.load_plugin(obj, config)
                         if plugin:
@@ -384,6 +484,7 @@ class PluginManager:
         plugin = self.get_plugin(plugin_name)
         if plugin:
             plugin.metadata.enabled = True
+            self.version += 1
             print(f"✓ Enabled plugin: {plugin_name}")
         else:
             print(f"Plugin not found: {plugin_name}")
@@ -392,10 +493,15 @@ class PluginManager:
         plugin = self.get_plugin(plugin_name)
         if plugin:
             plugin.metadata.enabled = False
+            self.version += 1
             print(f"✓ Disabled plugin: {plugin_name}")
         else:
             print(f"Plugin not found: {plugin_name}")
 
+    def set_plugin_visibility(self, plugin: HUDPlugin, visible: bool):
+        plugin.visible = visible
+        self.version += 1
+
     def load_plugins_with_dependencies(self, plugin_configs: List[tuple]) -> List[HUDPlugin]:
         plugin_names = [name for name, _ in plugin_configs]
 
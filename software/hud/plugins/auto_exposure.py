@@ -81,11 +81,21 @@ class AutoExposurePlugin(HUDPlugin):
         self.current_exposure: Optional[float] = None
         self.current_gain: Optional[float] = None
         self.current_brightness: float = 0.0
+        self._brightness_measured = False
         self.camera_controller: Optional[CameraController] = None
         self.auto_mode_enabled = True
         self.clahe = None
         self.show_stats = True
 
+        self._key_handlers = {
+            ord("e"): self._toggle_auto_mode,
+            ord("o"): self._toggle_stats,
+            ord("+"): self._increase_target_brightness,
+            ord("="): self._increase_target_brightness,
+            ord("-"): self._decrease_target_brightness,
+            ord("_"): self._decrease_target_brightness,
+        }
+
         if self.use_clahe:
             self.clahe = cv2.createCLAHE(clipLimit=self.CLAHE_CLIP_LIMIT, tileGridSize=self.CLAHE_TILE_GRID_SIZE)
 
@@ -210,11 +220,8 @@ class AutoExposurePlugin(HUDPlugin):
         return frame
 
     def update(self, delta_time: float):
-        raw_frame = self.get_data("raw_frame", None)
-
-        if raw_frame is not None and self.auto_mode_enabled:
-            self.current_brightness = self._calculate_scene_brightness(raw_frame)
-
+        # render() measures the camera frame before enhancement, so adjust from that rather than a copy of it
+        if self._brightness_measured and self.auto_mode_enabled:
             self._adjust_exposure(self.current_brightness)
             self._adjust_gain(self.current_brightness)
 
@@ -225,9 +232,8 @@ class AutoExposurePlugin(HUDPlugin):
         if not self.visible:
             return frame
 
-        self.provide_data("raw_frame", frame.copy())
-
         self.current_brightness = self._calculate_scene_brightness(frame)
+        self._brightness_measured = True
 
         frame = self._apply_software_enhancement(frame)
 
@@ -268,24 +274,27 @@ class AutoExposurePlugin(HUDPlugin):
         return frame
 
     def handle_key(self, key: int) -> bool:
-        if key == ord("e"):
-            self.auto_mode_enabled = not self.auto_mode_enabled
-            status = "ENABLED" if self.auto_mode_enabled else "DISABLED"
-            print(f"Auto Exposure: {status}")
-            return True
-        elif key == ord("o"):
-            self.show_stats = not self.show_stats
-            return True
-        elif key == ord("+") or key == ord("="):
-            self.target_brightness = min(255, self.target_brightness + self.TARGET_BRIGHTNESS_STEP)
-            print(f"Auto Exposure: Target brightness = {self.target_brightness}")
-            return True
-        elif key == ord("-") or key == ord("_"):
-            self.target_brightness = max(0, self.target_brightness - self.TARGET_BRIGHTNESS_STEP)
-            print(f"Auto Exposure: Target brightness = {self.target_brightness}")
-            return True
-
-        return False
+        handler = self._key_handlers.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+    def _toggle_auto_mode(self):
+        self.auto_mode_enabled = not self.auto_mode_enabled
+        status = "ENABLED" if self.auto_mode_enabled else "DISABLED"
+        print(f"Auto Exposure: {status}")
+
+    def _toggle_stats(self):
+        self.show_stats = not self.show_stats
+
+    def _increase_target_brightness(self):
+        self.target_brightness = min(255, self.target_brightness + self.TARGET_BRIGHTNESS_STEP)
+        print(f"Auto Exposure: Target brightness = {self.target_brightness}")
+
+    def _decrease_target_brightness(self):
+        self.target_brightness = max(0, self.target_brightness - self.TARGET_BRIGHTNESS_STEP)
+        print(f"Auto Exposure: Target brightness = {self.target_brightness}")
 
     def cleanup(self):
         if self.camera_controller is not None:
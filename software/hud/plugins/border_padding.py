@@ -8,7 +8,7 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from common.plugin_base import HUDContext, HUDPlugin, PluginConfig, PluginMetadata
+from common.plugin_base import HUDContext, HUDPlugin, PluginConfig, PluginMetadata, text_size
 
 
 class BorderPaddingPlugin(HUDPlugin):
@@ -39,6 +39,12 @@ class BorderPaddingPlugin(HUDPlugin):
         self.boundary_thickness = self.get_setting("boundary_thickness", 2)
         self.show_measurements = self.get_setting("show_measurements", True)
 
+        self._key_handlers = {
+            ord("["): self._decrease_padding,
+            ord("]"): self._increase_padding,
+            ord("b"): self._toggle_boundary_visibility,
+        }
+
     def initialize(self) -> bool:
         self._publish_padding_bounds_to_context()
         return True
@@ -101,9 +107,9 @@ class BorderPaddingPlugin(HUDPlugin):
     def _calculate_centered_text_position(self, text: str, center_x: int, center_y: int) -> tuple:
         font_scale = 0.4
         font_thickness = 1
-        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, font_thickness)[0]
-        text_x = center_x - text_size[0] // 2
-        text_y = center_y + text_size[1] // 2
+        text_width, text_height = text_size(text, font_scale, font_thickness)
+        text_x = center_x - text_width // 2
+        text_y = center_y + text_height // 2
         return text_x, text_y
 
     def _draw_all_padding_measurements(self, frame: np.ndarray):
@@ -162,16 +168,11 @@ class BorderPaddingPlugin(HUDPlugin):
         print(f"Border Padding Boundaries: {'ON' if self.show_boundaries else 'OFF'}")
 
     def handle_key(self, key: int) -> bool:
-        if key == ord("["):
-            self._decrease_padding()
-            return True
-        elif key == ord("]"):
-            self._increase_padding()
-            return True
-        elif key == ord("b"):
-            self._toggle_boundary_visibility()
-            return True
-        return False
+        handler = self._key_handlers.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
 
     def cleanup(self):
         pass
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Full-width horizontal sliding compass bar showing heading and direction markers."""
 
+import math
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -10,7 +11,7 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from common.plugin_base import HUDContext, HUDPlugin, PluginConfig, PluginMetadata, PluginPosition
+from common.plugin_base import HUDContext, HUDPlugin, PluginConfig, PluginMetadata, PluginPosition, text_size
 
 
 class CompassPlugin(HUDPlugin):
@@ -104,10 +105,8 @@ class CompassPlugin(HUDPlugin):
         )
 
     def _calculate_relative_angle(self, direction_angle: float) -> float:
-        relative_angle = (direction_angle - self.heading + 360) % 360
-        if relative_angle > 180:
-            relative_angle -= 360
-        return relative_angle
+        # Wraps into [-180, 180]
+        return math.remainder(direction_angle - self.heading, 360.0)
 
     def _is_direction_visible(self, relative_angle: float) -> bool:
         return abs(relative_angle) <= self.VISIBLE_DEGREES_PER_SIDE
@@ -131,8 +130,7 @@ class CompassPlugin(HUDPlugin):
     def _draw_direction_label(
         self, frame: np.ndarray, direction: str, marker_x: int, bar_y: int, tick_height: int, font_scale: float
     ):
-        text_size = cv2.getTextSize(direction, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)[0]
-        text_x = marker_x - text_size[0] // 2
+        text_x = marker_x - text_size(direction, font_scale, 1)[0] // 2
         cv2.putText(
             frame,
             direction,
@@ -179,9 +177,7 @@ class CompassPlugin(HUDPlugin):
 
     def _calculate_friendly_unit_relative_bearing(self, unit: dict) -> Optional[float]:
         bearing = unit.get("bearing", 0)
-        relative_bearing = (bearing - self.heading + 360) % 360
-        if relative_bearing > 180:
-            relative_bearing -= 360
+        relative_bearing = math.remainder(bearing - self.heading, 360.0)
 
         if abs(relative_bearing) <= self.VISIBLE_DEGREES_PER_SIDE:
             return relative_bearing
@@ -193,7 +189,9 @@ class CompassPlugin(HUDPlugin):
             relative_bearing = self._calculate_friendly_unit_relative_bearing(unit)
             if relative_bearing is not None:
                 visible_units.append((unit, relative_bearing))
-        return visible_units[: self.MAX_VISIBLE_FRIENDLY_UNITS]
+                if len(visible_units) == self.MAX_VISIBLE_FRIENDLY_UNITS:
+                    break
+        return visible_units
 
     def _create_friendly_unit_diamond_points(self, marker_x: int, bar_y: int) -> np.ndarray:
         return np.array(
@@ -223,10 +221,8 @@ class CompassPlugin(HUDPlugin):
 
     def _calculate_heading_text_position(self, center_x: int) -> int:
         heading_text = self._format_heading_text()
-        text_size = cv2.getTextSize(
-            heading_text, cv2.FONT_HERSHEY_SIMPLEX, self.HEADING_FONT_SCALE, self.HEADING_TEXT_THICKNESS
-        )[0]
-        return center_x - text_size[0] // 2
+        text_width = text_size(heading_text, self.HEADING_FONT_SCALE, self.HEADING_TEXT_THICKNESS)[0]
+        return center_x - text_width // 2
 
     def _draw_heading_with_glow(self, frame: np.ndarray, center_x: int, bar_y: int):
         heading_text = self._format_heading_text()
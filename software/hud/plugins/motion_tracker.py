@@ -114,21 +114,16 @@ class TerrainMapCache:
         start_x = center_x - tiles_wide // 2
         start_y = center_y - tiles_high // 2
 
-        tiles = []
-        for ty in range(start_y, start_y + tiles_high):
-            row = []
-            for tx in range(start_x, start_x + tiles_wide):
+        # Tiles are written straight into one buffer; missing tiles stay black
+        composite = np.zeros((tiles_high * tile_size, tiles_wide * tile_size, 3), dtype=np.uint8)
+        for row_index, ty in enumerate(range(start_y, start_y + tiles_high)):
+            ty_off = row_index * tile_size
+            for col_index, tx in enumerate(range(start_x, start_x + tiles_wide)):
                 tile = self.get_tile(zoom, tx, ty)
-                if tile is None:
-                    tile = np.zeros((tile_size, tile_size, 3), dtype=np.uint8)
-                row.append(tile)
-            if row:
-                tiles.append(np.hstack(row))
-
-        if not tiles:
-            return None
-
-        composite = np.vstack(tiles)
+                if tile is None or tile.shape != (tile_size, tile_size, 3):
+                    continue
+                tx_off = col_index * tile_size
+                composite[ty_off : ty_off + tile_size, tx_off : tx_off + tile_size] = tile
 
         n = 2.0**zoom
         pixel_x = ((lon + 180.0) / 360.0 * n - start_x) * tile_size
@@ -164,15 +159,20 @@ class TerrainMapCache:
 class TerrainOverlay:
     """Provides terrain map overlay for HUD components."""
 
-    def __init__(self, cache_dir: str = "cache/map_tiles"):
+    ROTATION_STEP_DEGREES = 10
+
+    def __init__(self, cache_dir: str = "cache/map_tiles", fast_rotation: bool = True):
         """Initialize terrain overlay system."""
         self.cache = TerrainMapCache(cache_dir)
+        self.fast_rotation = fast_rotation  # Nearest-neighbor warp; disable for smoother screenshots
         self.current_map_unrotated: Optional[np.ndarray] = None
         self.last_update_time = 0
         self.update_interval = 1.0  # Update map every 1 second
         self.last_lat = None
         self.last_lon = None
         self.last_radius_meters = None
+        self._pre_rotated: List[np.ndarray] = []
+        self._rotated_size: Optional[Tuple[int, int]] = None
 
     def _calculate_zoom_for_radius(self, radius_meters: float) -> int:
         """Calculate appropriate zoom level for a given radius in meters."""
@@ -205,58 +205,56 @@ class TerrainOverlay:
             or abs(lat - self.last_lat) > 0.0001
             or abs(lon - self.last_lon) > 0.0001
             or self.last_radius_meters != radius_meters
+            or self._rotated_size != (width, height)
         )
 
         if needs_update:
             zoom_level = self._calculate_zoom_for_radius(radius_meters)
-            fetch_size = max(width, height) * 3
+            # A square of side max(w, h) * sqrt(2) still covers the output at any rotation
+            fetch_size = math.ceil(max(width, height) * math.sqrt(2)) + 2
 
             self.current_map_unrotated = self.cache.get_map_region(lat, lon, zoom_level, fetch_size, fetch_size)
             self.last_update_time = current_time
             self.last_lat = lat
             self.last_lon = lon
             self.last_radius_meters = radius_meters
+            self._build_rotations(width, height)
 
-        if self.current_map_unrotated is None:
+        if not self._pre_rotated:
             return None
 
-        h, w = self.current_map_unrotated.shape[:2]
-        center = (w // 2, h // 2)
-
-        # Note: heading increases clockwise (0°=N, 90°=E, 180°=S, 270°=W)
-        # We want the map to rotate so the player's forward direction points up
-        # cv2 rotates positive angles counterclockwise, so we use +heading to rotate clockwise
-        rotation_matrix = cv2.getRotationMatrix2D(center, heading, 1.0)
-        rotated = cv2.warpAffine(
-            self.current_map_unrotated,
-            rotation_matrix,
-            (w, h),
-            flags=cv2.INTER_LINEAR,
-            borderMode=cv2.BORDER_CONSTANT,
-            borderValue=(0, 0, 0),
-        )
-
-        x1 = (w - width) // 2
-        y1 = (h - height) // 2
-        x2 = x1 + width
-        y2 = y1 + height
-
-        x1 = max(0, x1)
-        y1 = max(0, y1)
-        x2 = min(w, x2)
-        y2 = min(h, y2)
+        index = int(round(heading / self.ROTATION_STEP_DEGREES)) % len(self._pre_rotated)
+        return self._pre_rotated[index]
 
-        cropped = rotated[y1:y2, x1:x2]
+    def _build_rotations(self, width: int, height: int):
+        """Pre-render the current map at every quantized heading, cropped to the output size."""
+        self._pre_rotated = []
+        self._rotated_size = (width, height)
 
-        if cropped.shape[:2] != (height, width):
-            result = np.zeros((height, width, 3), dtype=np.uint8)
-            h_crop, w_crop = cropped.shape[:2]
-            h_use = min(h_crop, height)
-            w_use = min(w_crop, width)
-            result[:h_use, :w_use] = cropped[:h_use, :w_use]
-            return result
+        if self.current_map_unrotated is None:
+            return
 
-        return cropped
+        h, w = self.current_map_unrotated.shape[:2]
+        center = (w // 2, h // 2)
+        interpolation = cv2.INTER_NEAREST if self.fast_rotation else cv2.INTER_LINEAR
+
+        for angle in range(0, 360, self.ROTATION_STEP_DEGREES):
+            # Note: heading increases clockwise (0°=N, 90°=E, 180°=S, 270°=W)
+            # We want the map to rotate so the player's forward direction points up
+            # cv2 rotates positive angles counterclockwise, so we use +heading to rotate clockwise
+            rotation_matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+            # Shift so the map center lands in the middle of the (width, height) output
+            rotation_matrix[0, 2] -= (w - width) // 2
+            rotation_matrix[1, 2] -= (h - height) // 2
+            rotated = cv2.warpAffine(
+                self.current_map_unrotated,
+                rotation_matrix,
+                (width, height),
+                flags=interpolation,
+                borderMode=cv2.BORDER_CONSTANT,
+                borderValue=(0, 0, 0),
+            )
+            self._pre_rotated.append(rotated)
 
     def close(self):
         """Close resources."""
@@ -289,16 +287,28 @@ class MiniMapPlugin(HUDPlugin):
         consumes=["border_padding"],
     )
 
+    METERS_PER_DEGREE = 111111
+
     def __init__(self, context: HUDContext, config: PluginConfig):
         super().__init__(context, config)
 
         self.player_pos: Optional[dict] = None
         self.friendly_units: List[dict] = []
+        # Unit positions as parallel arrays, rebuilt only when a new friendly_units list is published
+        self._unit_lat = np.empty(0)
+        self._unit_lon = np.empty(0)
+        # Projected marker positions, reused until the units, player pose, zoom or map placement change
+        self._unit_markers: List[List[int]] = []
+        self._unit_markers_key: Optional[tuple] = None
+        # Meters per degree of longitude at the player's latitude, recomputed only when the latitude changes
+        self._player_lat: Optional[float] = None
+        self._lon_meters_per_degree = float(self.METERS_PER_DEGREE)
         self.zoom_level = self.get_setting("zoom_level", 300)
         self.show_terrain = self.get_setting("show_terrain", True)
+        self.fast_rotation = self.get_setting("fast_rotation", True)
 
         if self.show_terrain:
-            self.terrain = TerrainOverlay()
+            self.terrain = TerrainOverlay(fast_rotation=self.fast_rotation)
         else:
             self.terrain = None
 
@@ -311,6 +321,15 @@ class MiniMapPlugin(HUDPlugin):
         self.ring_color = (140, 140, 130)
         self.friendly_color = (255, 200, 100)
 
+        self._key_handlers = {
+            ord("m"): self._toggle_map,
+            ord("t"): self._toggle_terrain,
+            ord("+"): self._zoom_in,
+            ord("="): self._zoom_in,
+            ord("-"): self._zoom_out,
+            ord("_"): self._zoom_out,
+        }
+
     def initialize(self) -> bool:
         """Initialize mini-map plugin."""
         self.tracker_size = int(self.context.frame_width * 0.15)
@@ -324,28 +343,66 @@ class MiniMapPlugin(HUDPlugin):
         """Update mini-map state from context."""
         if "player_position" in self.context.state:
             self.player_pos = self.context.state["player_position"]
+            player_lat = self.player_pos.get("latitude", 0)
+            if player_lat != self._player_lat:
+                self._player_lat = player_lat
+                self._lon_meters_per_degree = self.METERS_PER_DEGREE * math.cos(math.radians(player_lat))
 
         if "friendly_units" in self.context.state:
-            self.friendly_units = self.context.state["friendly_units"]
+            units = self.context.state["friendly_units"]
+            if units is not self.friendly_units:
+                self.friendly_units = units
+                self._update_unit_positions()
+
+    def _update_unit_positions(self):
+        """Copy unit lat/lon into parallel arrays, skipping units without a fix."""
+        coords = [
+            (unit["latitude"], unit["longitude"])
+            for unit in self.friendly_units
+            if unit.get("latitude") is not None and unit.get("longitude") is not None
+        ]
+        positions = np.array(coords, dtype=np.float64).reshape(-1, 2)
+        self._unit_lat = positions[:, 0]
+        self._unit_lon = positions[:, 1]
+        self._unit_markers_key = None
 
     def _get_border_padding_data(self) -> dict:
         """Get current border padding values (soft dependency)."""
         return self.get_data("border_padding", {"padding_left": 0, "padding_bottom": 0})
 
-    def _lat_lon_to_meters(self, lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
-        """Convert lat/lon difference to meters."""
-        lat_diff = lat2 - lat1
-        lon_diff = lon2 - lon1
-        y_meters = lat_diff * 111111
-        x_meters = lon_diff * 111111 * math.cos(math.radians(lat1))
-        return x_meters, y_meters
+    def _project_units(self, center_x: int, center_y: int) -> np.ndarray:
+        """Return (N, 2) pixel positions of the friendly units that fall inside the map circle."""
+        player_lat = self.player_pos.get("latitude", 0)
+        player_lon = self.player_pos.get("longitude", 0)
+        heading_rad = math.radians(self.player_pos.get("heading", 0))
+
+        y_meters = (self._unit_lat - player_lat) * self.METERS_PER_DEGREE
+        x_meters = (self._unit_lon - player_lon) * self._lon_meters_per_degree
 
-    def _meters_to_pixels(self, x_meters: float, y_meters: float) -> Tuple[int, int]:
-        """Convert meter coordinates to pixel coordinates."""
+        cos_h = math.cos(heading_rad)
+        sin_h = math.sin(heading_rad)
         scale = self.radius / self.zoom_level
-        x_pixels = int(x_meters * scale)
-        y_pixels = int(-y_meters * scale)
-        return x_pixels, y_pixels
+        # astype truncates toward zero, matching int() on the scalar path
+        px = ((x_meters * cos_h - y_meters * sin_h) * scale).astype(np.int32)
+        py = (-(x_meters * sin_h + y_meters * cos_h) * scale).astype(np.int32)
+
+        inside = px * px + py * py <= self.radius * self.radius
+        return np.column_stack((px[inside] + center_x, py[inside] + center_y))
+
+    def _get_unit_markers(self, center_x: int, center_y: int) -> List[List[int]]:
+        """Projected unit positions, recomputed only on frames where something they depend on changed."""
+        markers_key = (
+            self.player_pos.get("latitude", 0),
+            self.player_pos.get("longitude", 0),
+            self.player_pos.get("heading", 0),
+            self.zoom_level,
+            center_x,
+            center_y,
+        )
+        if markers_key != self._unit_markers_key:
+            self._unit_markers = self._project_units(center_x, center_y).tolist()
+            self._unit_markers_key = markers_key
+        return self._unit_markers
 
     def render(self, frame: np.ndarray) -> np.ndarray:
         """Render circular mini-map with terrain overlay."""
@@ -388,13 +445,15 @@ class MiniMapPlugin(HUDPlugin):
             roi_x1, roi_x2 = x, x + self.tracker_size
 
             if roi_y2 <= frame.shape[0] and roi_x2 <= frame.shape[1] and roi_y1 >= 0 and roi_x1 >= 0:
-                frame_roi = frame[roi_y1:roi_y2, roi_x1:roi_x2].copy()
-                frame_roi[mask > 0] = terrain_masked[mask > 0]
-                frame[roi_y1:roi_y2, roi_x1:roi_x2] = frame_roi
+                np.copyto(frame[roi_y1:roi_y2, roi_x1:roi_x2], terrain_masked, where=(mask > 0)[:, :, None])
         else:
-            overlay = frame.copy()
-            cv2.circle(overlay, (center_x, center_y), self.radius + 5, self.bg_color, -1, cv2.LINE_AA)
-            cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+            # Blend just the circle's bounding square (plus a pixel for the anti-aliased edge), not the whole frame
+            extent = self.radius + 6
+            roi_x1, roi_y1 = max(center_x - extent, 0), max(center_y - extent, 0)
+            roi = frame[roi_y1 : center_y + extent + 1, roi_x1 : center_x + extent + 1]
+            overlay = roi.copy()
+            cv2.circle(overlay, (center_x - roi_x1, center_y - roi_y1), self.radius + 5, self.bg_color, -1, cv2.LINE_AA)
+            cv2.addWeighted(overlay, 0.5, roi, 0.5, 0, roi)
 
         cv2.circle(frame, (center_x, center_y), self.radius + 5, self.primary_color, 2, cv2.LINE_AA)
 
@@ -402,28 +461,8 @@ class MiniMapPlugin(HUDPlugin):
             ring_radius = int((self.radius / 3) * i)
             cv2.circle(frame, (center_x, center_y), ring_radius, self.ring_color, 1, cv2.LINE_AA)
 
-        for unit in self.friendly_units:
-            lat = unit.get("latitude")
-            lon = unit.get("longitude")
-            if lat is None or lon is None:
-                continue
-
-            x_meters, y_meters = self._lat_lon_to_meters(
-                self.player_pos.get("latitude", 0), self.player_pos.get("longitude", 0), lat, lon
-            )
-
-            heading_rad = math.radians(self.player_pos.get("heading", 0))
-            cos_h = math.cos(heading_rad)
-            sin_h = math.sin(heading_rad)
-            rotated_x = x_meters * cos_h - y_meters * sin_h
-            rotated_y = x_meters * sin_h + y_meters * cos_h
-
-            px, py = self._meters_to_pixels(rotated_x, rotated_y)
-            marker_x = center_x + px
-            marker_y = center_y + py
-
-            dist_from_center = math.sqrt(px**2 + py**2)
-            if dist_from_center <= self.radius:
+        if self._unit_lat.size:
+            for marker_x, marker_y in self._get_unit_markers(center_x, center_y):
                 cv2.circle(frame, (marker_x, marker_y), 4, self.friendly_color, -1, cv2.LINE_AA)
                 cv2.circle(frame, (marker_x, marker_y), 5, self.friendly_color, 1, cv2.LINE_AA)
 
@@ -460,20 +499,24 @@ class MiniMapPlugin(HUDPlugin):
 
     def handle_key(self, key: int) -> bool:
         """Handle keyboard input."""
-        if key == ord("m"):
-            self.toggle_visibility()
-            print(f"Mini-Map: {'ON' if self.visible else 'OFF'}")
-            return True
-        elif key == ord("t"):
-            self.show_terrain = not self.show_terrain
-            print(f"Terrain overlay: {'ON' if self.show_terrain else 'OFF'}")
-            return True
-        elif key == ord("+") or key == ord("="):
-            self.zoom_level = max(50, self.zoom_level - 50)
-            print(f"Map zoom: ±{self.zoom_level}m")
-            return True
-        elif key == ord("-") or key == ord("_"):
-            self.zoom_level = min(2000, self.zoom_level + 50)
-            print(f"Map zoom: ±{self.zoom_level}m")
-            return True
-        return False
+        handler = self._key_handlers.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+    def _toggle_map(self):
+        self.toggle_visibility()
+        print(f"Mini-Map: {'ON' if self.visible else 'OFF'}")
+
+    def _toggle_terrain(self):
+        self.show_terrain = not self.show_terrain
+        print(f"Terrain overlay: {'ON' if self.show_terrain else 'OFF'}")
+
+    def _zoom_in(self):
+        self.zoom_level = max(50, self.zoom_level - 50)
+        print(f"Map zoom: ±{self.zoom_level}m")
+
+    def _zoom_out(self):
+        self.zoom_level = min(2000, self.zoom_level + 50)
+        print(f"Map zoom: ±{self.zoom_level}m")
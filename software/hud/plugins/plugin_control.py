@@ -86,6 +86,13 @@ class PluginControlPanel(HUDPlugin):
         self.disabled_color = (100, 100, 100)
         self.border_color = (180, 180, 170)
 
+        # Panel contents rasterized once per state change; per frame only the background blend and ink composite run
+        self._panel_key: Optional[tuple] = None
+        self._panel_points: Optional[tuple] = None
+        self._panel_ink: Optional[np.ndarray] = None
+        self._panel_transmit: Optional[np.ndarray] = None
+        self._panel_background: Optional[np.ndarray] = None
+
     def _setup_arrow_keys(self):
         system = platform.system()
         if system == "Windows":
@@ -95,6 +102,10 @@ class PluginControlPanel(HUDPlugin):
             self.KEY_UP_ARROW = 82
             self.KEY_DOWN_ARROW = 84
 
+        self._up_keys = frozenset({self.KEY_UP_ARROW, ord("k")})
+        self._down_keys = frozenset({self.KEY_DOWN_ARROW, ord("j")})
+        self._navigation_keys = self._up_keys | self._down_keys
+
     def initialize(self) -> bool:
         self.config.position = PluginPosition.CENTER
         self.config.z_index = self.Z_INDEX_OVERLAY
@@ -136,9 +147,14 @@ class PluginControlPanel(HUDPlugin):
     def _draw_semi_transparent_background(
         self, frame: np.ndarray, panel_x: int, panel_y: int, panel_width: int, panel_height: int
     ):
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (panel_x, panel_y), (panel_x + panel_width, panel_y + panel_height), self.bg_color, -1)
-        cv2.addWeighted(overlay, self.PANEL_BACKGROUND_ALPHA, frame, 1.0 - self.PANEL_BACKGROUND_ALPHA, 0, frame)
+        # Blend only the panel region; pixels outside it would come back unchanged anyway
+        roi = frame[panel_y : panel_y + panel_height + 1, panel_x : panel_x + panel_width + 1]
+        if self._panel_background is None or self._panel_background.shape != roi.shape:
+            self._panel_background = np.empty_like(roi)
+            self._panel_background[:] = self.bg_color
+        cv2.addWeighted(
+            self._panel_background, self.PANEL_BACKGROUND_ALPHA, roi, 1.0 - self.PANEL_BACKGROUND_ALPHA, 0, roi
+        )
 
     def _draw_panel_border(self, frame: np.ndarray, panel_x: int, panel_y: int, panel_width: int, panel_height: int):
         cv2.rectangle(
@@ -329,17 +345,49 @@ class PluginControlPanel(HUDPlugin):
 
         panel_width, panel_height, panel_x, panel_y = self._calculate_panel_dimensions(frame_width, frame_height)
 
+        # The manager's version covers plugin list and toggle changes, so an unchanged panel costs no list walk
+        manager = self._get_plugin_manager_from_context()
+        manager_version = manager.version if manager is not None else None
+        if (panel_width, panel_height, self.auto_reload, self.selected_index, manager_version) != self._panel_key:
+            plugins = self._get_plugins_list()
+            if plugins:
+                self._ensure_valid_selection_index(len(plugins))
+            self._build_panel_sprite(plugins, panel_width, panel_height)
+            self._panel_key = (panel_width, panel_height, self.auto_reload, self.selected_index, manager_version)
+
         self._draw_semi_transparent_background(frame, panel_x, panel_y, panel_width, panel_height)
-        self._draw_panel_border(frame, panel_x, panel_y, panel_width, panel_height)
-        self._draw_title(frame, panel_x, panel_y)
-        self._draw_auto_reload_status(frame, panel_x, panel_y, panel_width)
 
-        plugins = self._get_plugins_list()
-        self._draw_plugins_list(frame, plugins, panel_x, panel_y, panel_width)
-        self._draw_help_section(frame, panel_x, panel_y, panel_height)
+        pad = self.PANEL_BORDER_THICKNESS
+        roi = frame[panel_y - pad : panel_y + panel_height + pad + 1, panel_x - pad : panel_x + panel_width + pad + 1]
+        underlying = roi[self._panel_points]
+        roi[self._panel_points] = self._panel_ink + self._panel_transmit * underlying
 
         return frame
 
+    def _draw_panel_contents(self, canvas: np.ndarray, plugins: List[Dict], panel_width: int, panel_height: int):
+        pad = self.PANEL_BORDER_THICKNESS
+        self._draw_panel_border(canvas, pad, pad, panel_width, panel_height)
+        self._draw_title(canvas, pad, pad)
+        self._draw_auto_reload_status(canvas, pad, pad, panel_width)
+        self._draw_plugins_list(canvas, plugins, pad, pad, panel_width)
+        self._draw_help_section(canvas, pad, pad, panel_height)
+
+    def _build_panel_sprite(self, plugins: List[Dict], panel_width: int, panel_height: int):
+        """Rasterize the panel on black and on white to recover each pixel's anti-aliased ink and coverage."""
+        # Pad by the border thickness, since the outline is centred on the panel edge
+        pad = self.PANEL_BORDER_THICKNESS
+        shape = (panel_height + 2 * pad + 1, panel_width + 2 * pad + 1, 3)
+        on_black = np.zeros(shape, dtype=np.uint8)
+        on_white = np.full(shape, 255, dtype=np.uint8)
+        self._draw_panel_contents(on_black, plugins, panel_width, panel_height)
+        self._draw_panel_contents(on_white, plugins, panel_width, panel_height)
+
+        # Drawn pixel = ink + transmit * underlying pixel; transmit is 1 wherever nothing was drawn
+        transmit = (on_white.astype(np.float32) - on_black) / 255.0
+        self._panel_points = np.nonzero(np.any(transmit < 1.0, axis=2))
+        self._panel_ink = on_black[self._panel_points].astype(np.float32) + 0.5
+        self._panel_transmit = transmit[self._panel_points]
+
     def _toggle_panel_visibility(self):
         self.toggle_visibility()
         print(f"Plugin Control Panel: {'ON' if self.visible else 'OFF'}")
@@ -355,13 +403,13 @@ class PluginControlPanel(HUDPlugin):
         self.selected_index = (self.selected_index + 1) % plugin_count
 
     def _is_navigation_key(self, key: int) -> bool:
-        return key in [self.KEY_UP_ARROW, self.KEY_DOWN_ARROW, ord("k"), ord("j")]
+        return key in self._navigation_keys
 
     def _handle_navigation(self, key: int, plugin_count: int) -> bool:
-        if key == self.KEY_UP_ARROW or key == ord("k"):
+        if key in self._up_keys:
             self._handle_navigation_up(plugin_count)
             return True
-        elif key == self.KEY_DOWN_ARROW or key == ord("j"):
+        elif key in self._down_keys:
             self._handle_navigation_down(plugin_count)
             return True
         return False
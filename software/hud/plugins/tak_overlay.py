@@ -23,6 +23,7 @@ class TAKOverlayPlugin(HUDPlugin):
     POI_TEXT_THICKNESS = 1
     LABEL_OFFSET_X = 10
     LABEL_OFFSET_Y = -5
+    EARTH_RADIUS_METERS = 6371000
 
     FRIENDLY_COLOR = (100, 255, 100)
     HOSTILE_COLOR = (0, 100, 255)
@@ -44,6 +45,15 @@ class TAKOverlayPlugin(HUDPlugin):
         self.pois: List[Dict] = []
         self.player_position: Optional[Dict] = None
         self.player_heading: float = 0.0
+        self._player_phi = 0.0
+        self._cos_player_phi = 1.0
+        self._sin_player_phi = 0.0
+        self._player_fix: Optional[Tuple[float, float]] = None
+        # POI coordinates as parallel arrays, rebuilt only when the POI set changes
+        self._poi_lat = np.empty(0)
+        self._poi_lon = np.empty(0)
+        # (distance, bearing) per POI, kept until the player fix or the POI set changes
+        self._poi_geometry: Optional[List[Tuple[float, float]]] = None
 
     def initialize(self) -> bool:
         self.config.position = PluginPosition.CUSTOM
@@ -53,35 +63,54 @@ class TAKOverlayPlugin(HUDPlugin):
         self.player_position = self.context.state.get("player_position")
         if self.player_position:
             self.player_heading = self.player_position.get("heading", 0.0)
+            player_fix = (self.player_position["latitude"], self.player_position["longitude"])
+            if player_fix != self._player_fix:
+                self._player_fix = player_fix
+                # Player-only terms of the haversine and bearing formulas, shared by every POI
+                self._player_phi = math.radians(player_fix[0])
+                self._cos_player_phi = math.cos(self._player_phi)
+                self._sin_player_phi = math.sin(self._player_phi)
+                self._poi_geometry = None
 
         tak_client = self.context.state.get("tak_client")
         if tak_client:
-            self.pois = tak_client.get_pois()
-
-    def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance in meters using Haversine formula."""
-        R = 6371000
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
-
-    def _calculate_bearing(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate bearing from point 1 to point 2 in degrees."""
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        y = math.sin(delta_lambda) * math.cos(phi2)
-        x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(delta_lambda)
-        theta = math.atan2(y, x)
-
-        return (math.degrees(theta) + 360) % 360
+            # get_pois() returns a fresh list each call, but a POI report only replaces its own dict
+            pois = tak_client.get_pois()
+            if len(pois) != len(self.pois) or any(new is not old for new, old in zip(pois, self.pois)):
+                self.pois = pois
+                self._update_poi_positions()
+                self._poi_geometry = None
+
+        # Turning in place only changes the heading, which is applied per frame in projection
+        if self.player_position and self._poi_geometry is None:
+            distances, bearings = self._calculate_distances_and_bearings(self._poi_lat, self._poi_lon)
+            self._poi_geometry = list(zip(distances.tolist(), bearings.tolist()))
+
+    def _update_poi_positions(self):
+        """Copy POI lat/lon into parallel arrays."""
+        positions = np.array([(poi["latitude"], poi["longitude"]) for poi in self.pois], dtype=np.float64)
+        positions = positions.reshape(-1, 2)
+        self._poi_lat = positions[:, 0]
+        self._poi_lon = positions[:, 1]
+
+    def _calculate_distances_and_bearings(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Haversine distances in meters and initial bearings in degrees from the player to each point."""
+        phi2 = np.radians(lats)
+        cos_phi2 = np.cos(phi2)
+        delta_phi = phi2 - self._player_phi
+        delta_lambda = np.radians(lons - self.player_position["longitude"])
+
+        a = np.sin(delta_phi / 2) ** 2 + self._cos_player_phi * cos_phi2 * np.sin(delta_lambda / 2) ** 2
+        # Same as 2 * atan2(sqrt(a), sqrt(1 - a)); a can round a hair above 1 for antipodal points
+        distances = self.EARTH_RADIUS_METERS * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+        y = np.sin(delta_lambda) * cos_phi2
+        x = self._cos_player_phi * np.sin(phi2) - self._sin_player_phi * cos_phi2 * np.cos(delta_lambda)
+        # arctan2 is already in [-180, 180], so a single wrap replaces the modulo
+        bearings = np.degrees(np.arctan2(y, x))
+        bearings[bearings < 0] += 360.0
+
+        return distances, bearings
 
     def _get_poi_color(self, poi_type: str) -> Tuple[int, int, int]:
         """Determine POI marker color based on CoT type."""
@@ -95,27 +124,13 @@ class TAKOverlayPlugin(HUDPlugin):
             return self.UNKNOWN_COLOR
 
     def _project_poi_to_screen(
-        self, poi: Dict, frame_width: int, frame_height: int, fov: float = 90.0
+        self, poi: Dict, distance: float, bearing: float, frame_width: int, frame_height: int, fov: float = 90.0
     ) -> Optional[Tuple[int, int, float, str]]:
         """Project POI to screen coordinates based on bearing and distance."""
-        if not self.player_position:
-            return None
-
-        player_lat = self.player_position["latitude"]
-        player_lon = self.player_position["longitude"]
-        poi_lat = poi["latitude"]
-        poi_lon = poi["longitude"]
-
-        distance = self._calculate_distance(player_lat, player_lon, poi_lat, poi_lon)
-
         if distance > self.MAX_DISTANCE_METERS:
             return None
 
-        bearing = self._calculate_bearing(player_lat, player_lon, poi_lat, poi_lon)
-        relative_bearing = (bearing - self.player_heading + 360) % 360
-
-        if relative_bearing > 180:
-            relative_bearing -= 360
+        relative_bearing = math.remainder(bearing - self.player_heading, 360.0)
 
         half_fov = fov / 2
         if abs(relative_bearing) > half_fov:
@@ -178,8 +193,8 @@ class TAKOverlayPlugin(HUDPlugin):
         frame_height, frame_width = frame.shape[:2]
 
         visible_pois = []
-        for poi in self.pois:
-            projection = self._project_poi_to_screen(poi, frame_width, frame_height)
+        for poi, (distance, bearing) in zip(self.pois, self._poi_geometry):
+            projection = self._project_poi_to_screen(poi, distance, bearing, frame_width, frame_height)
             if projection:
                 screen_x, screen_y, distance, callsign = projection
                 visible_pois.append((distance, screen_x, screen_y, callsign, poi))
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """YOLO-based object detection with friend/foe classification."""
 
-import random
 import sys
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -11,7 +10,9 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from common.data_models import YOLODetection
 from common.plugin_base import HUDContext, HUDPlugin, PluginConfig, PluginMetadata
+from core.yolo_worker import Detections, YOLOInferenceWorker, extract_detections, load_model, select_device
 
 try:
     from ultralytics import YOLO
@@ -21,6 +22,9 @@ except ImportError:
     YOLO_AVAILABLE = False
     print("Warning: ultralytics not available for YOLO detection")
 
+_KEY_Y = ord("y")
+_KEY_V = ord("v")
+
 
 class YOLODetectionPlugin(HUDPlugin):
     DEFAULT_MODEL_PATH = "yolo11n-seg.pt"
@@ -29,8 +33,20 @@ class YOLODetectionPlugin(HUDPlugin):
     DEFAULT_FOE_COLOR = (0, 100, 255)
     DEFAULT_SHOW_SEGMENTATION = True
     DEFAULT_SHOW_BOXES = False
+    DEFAULT_EXPORT_FORMAT = None
+    DEFAULT_EXPORT_INT8 = True
+    DEFAULT_CALIBRATION_DATA = "coco8.yaml"
+    SUPPORTED_EXPORT_FORMATS = ("onnx", "openvino")
+    DEFAULT_ASYNC_INFERENCE = True
+    DEFAULT_COMPILE_MODEL = False
+    DEFAULT_INFERENCE_IMGSZ = 416
+    DEFAULT_INFERENCE_STRIDE = 2
+    AREA_INTERPOLATION_SCALE = 0.5
     PERSON_CLASS_ID = 0
+    NMS_IOU_THRESHOLD = 0.5
+    IDENTITY_HASH_MULTIPLIER = 2654435761
     BOUNDING_BOX_THICKNESS = 2
+    BOX_CORNER_INDEX = np.array([[0, 1], [2, 1], [2, 3], [0, 3]])
     SEGMENTATION_THICKNESS = 2
     SEGMENTATION_ALPHA = 0.3
     LABEL_FONT_SCALE = 0.4
@@ -55,13 +71,39 @@ class YOLODetectionPlugin(HUDPlugin):
         self.model_path = config.settings.get("model_path", self.DEFAULT_MODEL_PATH)
         self.confidence_threshold = config.settings.get("confidence_threshold", self.DEFAULT_CONFIDENCE_THRESHOLD)
 
+        self.compile_model = config.settings.get("compile_model", self.DEFAULT_COMPILE_MODEL)
+        self.export_format = config.settings.get("export_format", self.DEFAULT_EXPORT_FORMAT)
+        self.export_int8 = config.settings.get("export_int8", self.DEFAULT_EXPORT_INT8)
+        self.calibration_data = config.settings.get("calibration_data", self.DEFAULT_CALIBRATION_DATA)
+
         self.friend_color = tuple(config.settings.get("friend_color", list(self.DEFAULT_FRIEND_COLOR)))
         self.foe_color = tuple(config.settings.get("foe_color", list(self.DEFAULT_FOE_COLOR)))
 
         self.show_segmentation = config.settings.get("show_segmentation", self.DEFAULT_SHOW_SEGMENTATION)
         self.show_boxes = config.settings.get("show_boxes", self.DEFAULT_SHOW_BOXES)
 
-        self.tracked_identities: Dict[int, Tuple[int, int, int]] = {}
+        self.inference_imgsz = config.settings.get("inference_imgsz", self.DEFAULT_INFERENCE_IMGSZ)
+        self._inference_scale = np.ones(4, dtype=np.float32)
+
+        # Run inference on every Nth frame; boxes are carried forward by per-track velocity in between
+        self.inference_stride = max(1, int(config.settings.get("inference_stride", self.DEFAULT_INFERENCE_STRIDE)))
+        self._frame_counter = 0
+        self._last_detections: Optional[Detections] = None
+        self._motion_source: Optional[Detections] = None
+        self._motion_boxes = np.empty((0, 4), dtype=np.float32)
+        self._box_velocity = np.empty((0, 4), dtype=np.float32)
+        self._frames_since_detection = 0
+
+        self._key_handlers = {_KEY_Y: self._toggle_detection, _KEY_V: self._cycle_display_mode}
+
+        self._identity_choices = ((self.friend_color, "FRIEND"), (self.foe_color, "FOE"))
+
+        # Async mode: inference runs in a separate process and render() draws the latest finished detections,
+        # which lag the displayed frame by about one frame
+        self.async_inference = config.settings.get("async_inference", self.DEFAULT_ASYNC_INFERENCE)
+        self._resolved_model_path: Optional[str] = None
+        self._device = "cpu"
+        self._worker: Optional[YOLOInferenceWorker] = None
 
     def initialize(self) -> bool:
         if not YOLO_AVAILABLE:
@@ -69,59 +111,143 @@ class YOLODetectionPlugin(HUDPlugin):
             return False
 
         try:
-            print(f"Loading YOLO model: {self.model_path}")
-            self.model = YOLO(self.model_path)
-            self.model.to("cpu")
+            self._resolved_model_path = self._resolve_model_path()
+            self._device = select_device()
+            if self.async_inference:
+                # The worker process loads its own copy once the first frame fixes the shared buffer size
+                print(f"YOLO model will load in inference process: {self._resolved_model_path}")
+                self.model_loaded = True
+                return True
+
+            print(f"Loading YOLO model: {self._resolved_model_path}")
+            self.model = load_model(self._resolved_model_path, self._device, self.compile_model, self.inference_imgsz)
             self.model_loaded = True
-            print("YOLO model loaded successfully (CPU mode)")
+            print(f"YOLO model loaded successfully ({self._device.upper()} mode)")
             return True
         except Exception as e:
             print(f"Failed to load YOLO model: {e}")
             return False
 
-    def update(self, delta_time: float):
-        pass
+    def _get_exported_model_path(self) -> Path:
+        weights = Path(self.model_path)
+        if self.export_format == "onnx":
+            return weights.with_suffix(".onnx")
+        suffix = "_int8_openvino_model" if self.export_int8 else "_openvino_model"
+        return weights.parent / f"{weights.stem}{suffix}"
+
+    def _resolve_model_path(self) -> str:
+        """Return the path to load, exporting .pt weights to ONNX/OpenVINO once if configured."""
+        if not self.export_format or not self.model_path.endswith(".pt"):
+            return self.model_path
 
-    def _assign_friend_or_foe_color(self, track_id: int) -> Tuple[int, int, int]:
-        if track_id not in self.tracked_identities:
-            self.tracked_identities[track_id] = random.choice([self.friend_color, self.foe_color])
-        return self.tracked_identities[track_id]
+        if self.export_format not in self.SUPPORTED_EXPORT_FORMATS:
+            print(f"YOLO: Unsupported export_format '{self.export_format}', using PyTorch weights")
+            return self.model_path
 
-    def _get_status_label(self, color: Tuple[int, int, int]) -> str:
-        return "FRIEND" if color == self.friend_color else "FOE"
+        exported_path = self._get_exported_model_path()
+        if exported_path.exists():
+            return str(exported_path)
 
-    def _format_detection_label(self, status: str, track_id: int, confidence: float) -> str:
-        return f"{status} #{track_id} {confidence:.2f}"
+        try:
+            print(f"Exporting {self.model_path} to {self.export_format} (one-time)...")
+            export_args = {"format": self.export_format}
+            if self.export_format == "openvino" and self.export_int8:
+                export_args.update(int8=True, data=self.calibration_data)
+            return str(YOLO(self.model_path).export(**export_args))
+        except Exception as e:
+            print(f"YOLO export failed, using PyTorch weights: {e}")
+            return self.model_path
 
-    def _draw_bounding_box(self, frame: np.ndarray, x1: int, y1: int, x2: int, y2: int, color: Tuple[int, int, int]):
-        if self.show_boxes:
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, self.BOUNDING_BOX_THICKNESS, cv2.LINE_AA)
+    def _start_worker(self, frame_shape: Tuple[int, ...]):
+        self._worker = YOLOInferenceWorker(
+            self._resolved_model_path, frame_shape, self._get_track_kwargs(), self.compile_model
+        )
+        self._worker.start()
 
-    def _draw_segmentation_mask(self, frame: np.ndarray, mask: np.ndarray, color: Tuple[int, int, int]):
-        if not self.show_segmentation or mask is None:
+    def _stop_worker(self):
+        if self._worker is None:
             return
-
+        self._worker.stop()
+        self._worker = None
+
+    def _submit_frame(self, frame: np.ndarray):
+        inference_frame = self._prepare_inference_frame(frame)
+        if self._worker is not None and self._worker.frame_shape != inference_frame.shape:
+            self._stop_worker()
+        if self._worker is None:
+            self._start_worker(inference_frame.shape)
+        self._worker.submit(inference_frame)
+
+    def _prepare_inference_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale the frame to the inference size and remember how to map boxes back."""
         h, w = frame.shape[:2]
+        scale = self.inference_imgsz / max(h, w)
+        if scale >= 1.0:
+            self._inference_scale[:] = 1.0
+            return frame
 
-        if mask.shape != (h, w):
-            mask = cv2.resize(mask, (w, h), interpolation=cv2.INTER_LINEAR)
-
-        mask_binary = (mask > 0.5).astype(np.uint8)
-
-        contours, _ = cv2.findContours(mask_binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        size = (round(w * scale), round(h * scale))
+        # INTER_AREA keeps small distant people visible when shrinking by more than 2x
+        interpolation = cv2.INTER_AREA if scale < self.AREA_INTERPOLATION_SCALE else cv2.INTER_LINEAR
+        small = cv2.resize(frame, size, interpolation=interpolation)
+        self._inference_scale[:] = (w / size[0], h / size[1], w / size[0], h / size[1])
+        return small
 
-        if not contours:
+    def update(self, delta_time: float):
+        if self._worker is not None and self._worker.has_failed():
+            self._fall_back_to_sync_inference()
+
+    def _fall_back_to_sync_inference(self):
+        """Load the model in this process once the inference worker could not load it or has died."""
+        print("YOLO inference process failed, falling back to in-process inference")
+        self._stop_worker()
+        self.async_inference = False
+        try:
+            self.model = load_model(self._resolved_model_path, self._device, self.compile_model, self.inference_imgsz)
+        except Exception as e:
+            print(f"Failed to load YOLO model, disabling detection: {e}")
+            self.model_loaded = False
+
+    def _assign_identities(self, track_ids: np.ndarray) -> np.ndarray:
+        """Map tracks to indices into _identity_choices deterministically, so identities stay stable."""
+        # Knuth multiplicative hash; the top bit of the 32-bit product is well mixed even for sequential ids
+        hashed = (track_ids.astype(np.int64) * self.IDENTITY_HASH_MULTIPLIER) & 0xFFFFFFFF
+        return hashed >> 31
+
+    def _draw_bounding_boxes(self, frame: np.ndarray, boxes: np.ndarray, identities: np.ndarray):
+        """Draw all boxes with one polylines call per identity color."""
+        corners = boxes[:, self.BOX_CORNER_INDEX]
+
+        for identity, (color, _) in enumerate(self._identity_choices):
+            selected = corners[identities == identity]
+            if len(selected):
+                cv2.polylines(frame, selected, True, color, self.BOUNDING_BOX_THICKNESS, cv2.LINE_AA)
+
+    def _draw_segmentation_mask(
+        self, frame: np.ndarray, outline: np.ndarray, color: Tuple[int, int, int], offset: Tuple[int, int] = (0, 0)
+    ):
+        if not self.show_segmentation or outline is None or len(outline) == 0:
             return
 
-        overlay = frame.copy()
-        cv2.fillPoly(overlay, contours, color)
-
-        mask_area = mask_binary.astype(bool)
-        frame[mask_area] = cv2.addWeighted(
-            overlay[mask_area], self.SEGMENTATION_ALPHA, frame[mask_area], 1 - self.SEGMENTATION_ALPHA, 0
-        )
+        h, w = frame.shape[:2]
+        points = np.rint(outline * self._inference_scale[:2] + offset).astype(np.int32)
+
+        # Blend inside the outline's bounding box only, clipped since a predicted offset can push it off the frame
+        x, y, box_w, box_h = cv2.boundingRect(points)
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + box_w, w), min(y + box_h, h)
+        if x1 < x2 and y1 < y2:
+            roi = frame[y1:y2, x1:x2]
+            mask_area = np.zeros(roi.shape[:2], dtype=np.uint8)
+            cv2.fillPoly(mask_area, [points], 1, offset=(-x1, -y1))
+            mask_area = mask_area.view(bool)
+
+            pixels = roi[mask_area]
+            roi[mask_area] = cv2.addWeighted(
+                np.full_like(pixels, color), self.SEGMENTATION_ALPHA, pixels, 1 - self.SEGMENTATION_ALPHA, 0
+            )
 
-        cv2.drawContours(frame, contours, -1, color, self.SEGMENTATION_THICKNESS, cv2.LINE_AA)
+        cv2.polylines(frame, [points], True, color, self.SEGMENTATION_THICKNESS, cv2.LINE_AA)
 
     def _draw_detection_label(
         self, frame: np.ndarray, label: str, x1: int, y1: int, x2: int, color: Tuple[int, int, int]
@@ -143,67 +269,83 @@ class YOLODetectionPlugin(HUDPlugin):
             cv2.LINE_AA,
         )
 
-    def _process_detection(
-        self,
-        frame: np.ndarray,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        track_id: int,
-        confidence: float,
-        mask: Optional[np.ndarray] = None,
-    ):
-        box_color = self._assign_friend_or_foe_color(track_id)
-        status = self._get_status_label(box_color)
-        label = self._format_detection_label(status, track_id, confidence)
-
-        if mask is not None:
-            self._draw_segmentation_mask(frame, mask, box_color)
-
-        self._draw_bounding_box(frame, x1, y1, x2, y2, box_color)
-        self._draw_detection_label(frame, label, x1, y1, x2, box_color)
-
-    def _meets_confidence_threshold(self, confidence: float) -> bool:
-        return confidence >= self.confidence_threshold
+    def _draw_detection_text(self, frame: np.ndarray, detection: YOLODetection, color: Tuple[int, int, int]):
+        x1, y1, x2, _ = detection.bbox
+        label = f"{detection.identity} #{detection.track_id} {detection.confidence:.2f}"
+        self._draw_detection_label(frame, label, x1, y1, x2, color)
+
+    def _get_track_kwargs(self) -> Dict:
+        return {
+            "persist": True,
+            "verbose": False,
+            "device": self._device,
+            # FP16 on CUDA; Ultralytics handles the model and input casting
+            "half": self._device == "cuda",
+            "classes": [self.PERSON_CLASS_ID],
+            # Low-confidence boxes are dropped in the model's NMS step rather than filtered afterwards
+            "conf": self.confidence_threshold,
+            "iou": self.NMS_IOU_THRESHOLD,
+            "imgsz": self.inference_imgsz,
+        }
 
     def _run_yolo_tracking(self, frame: np.ndarray):
-        return self.model.track(frame, persist=True, verbose=False, device="cpu", classes=[self.PERSON_CLASS_ID])
-
-    def _process_all_detections(self, frame: np.ndarray, results):
-        detections_list = []
-
-        if results[0].boxes.id is None:
-            return
-
-        has_masks = hasattr(results[0], "masks") and results[0].masks is not None
-
-        boxes_data = zip(results[0].boxes.xyxy, results[0].boxes.id, results[0].boxes.conf)
-
-        for idx, box_data in enumerate(boxes_data):
-            bbox, track_id, confidence = box_data
-            x1, y1, x2, y2 = map(int, bbox)
-            track_id = int(track_id)
-            confidence = float(confidence)
-
-            if not self._meets_confidence_threshold(confidence):
-                continue
+        return self.model.track(frame, **self._get_track_kwargs())
+
+    def _predict_boxes(self, detections: Detections) -> np.ndarray:
+        """Return display-space boxes, advanced by each track's last velocity on frames without new results."""
+        if detections is not self._motion_source:
+            xyxy, ids = detections[0], detections[1]
+            boxes = xyxy * self._inference_scale
+            velocity = np.zeros_like(boxes)
+
+            if self._motion_source is not None:
+                _, new_idx, prev_idx = np.intersect1d(ids, self._motion_source[1], return_indices=True)
+                elapsed = self._frames_since_detection + 1
+                velocity[new_idx] = (boxes[new_idx] - self._motion_boxes[prev_idx]) / elapsed
+
+            self._motion_source = detections
+            self._motion_boxes = boxes
+            self._box_velocity = velocity
+            self._frames_since_detection = 0
+        else:
+            self._frames_since_detection += 1
+
+        return self._motion_boxes + self._box_velocity * self._frames_since_detection
+
+    def _process_all_detections(self, frame: np.ndarray, detections: Detections):
+        _, ids, conf, outlines = detections
+        xyxy = self._predict_boxes(detections).astype(np.int32)
+        identities = self._assign_identities(ids)
+        mask_count = len(outlines) if outlines is not None else 0
+
+        # Cast, hash and threshold happen on whole arrays above; convert each array to Python once here
+        colors = [self._identity_choices[identity][0] for identity in identities.tolist()]
+        detections_list = [
+            YOLODetection(
+                bbox=tuple(bbox),
+                track_id=track_id,
+                confidence=confidence,
+                identity=self._identity_choices[identity][1],
+                has_mask=idx < mask_count,
+            )
+            for idx, (bbox, track_id, confidence, identity) in enumerate(
+                zip(xyxy.tolist(), ids.tolist(), conf.tolist(), identities.tolist())
+            )
+        ]
 
-            mask = None
-            if has_masks and idx < len(results[0].masks.data):
-                mask = results[0].masks.data[idx].cpu().numpy()
+        if mask_count:
+            # Masks come from the last inference; move each one with its box's predicted centre
+            shift = self._box_velocity * self._frames_since_detection
+            mask_offsets = np.rint((shift[:, :2] + shift[:, 2:]) / 2).astype(np.int32).tolist()
+            for idx, detection in enumerate(detections_list):
+                if detection.has_mask:
+                    self._draw_segmentation_mask(frame, outlines[idx], colors[idx], tuple(mask_offsets[idx]))
 
-            self._process_detection(frame, x1, y1, x2, y2, track_id, confidence, mask)
+        if self.show_boxes and detections_list:
+            self._draw_bounding_boxes(frame, xyxy, identities)
 
-            detections_list.append(
-                {
-                    "bbox": (x1, y1, x2, y2),
-                    "track_id": track_id,
-                    "confidence": confidence,
-                    "identity": self._get_status_label(self._assign_friend_or_foe_color(track_id)),
-                    "has_mask": mask is not None,
-                }
-            )
+        for detection, color in zip(detections_list, colors):
+            self._draw_detection_text(frame, detection, color)
 
         self.provide_data("yolo_detections", detections_list)
 
@@ -212,40 +354,60 @@ class YOLODetectionPlugin(HUDPlugin):
             return frame
 
         try:
-            results = self._run_yolo_tracking(frame)
-            self._process_all_detections(frame, results)
+            run_inference = self._frame_counter % self.inference_stride == 0
+            self._frame_counter += 1
+
+            if self.async_inference:
+                if run_inference:
+                    self._submit_frame(frame)
+                detections = self._worker.latest() if self._worker is not None else None
+            else:
+                if run_inference:
+                    results = self._run_yolo_tracking(self._prepare_inference_frame(frame))
+                    self._last_detections = extract_detections(results)
+                detections = self._last_detections
+
+            if detections is not None:
+                self._process_all_detections(frame, detections)
+            else:
+                # Keep counting so the next velocity estimate is spread over every frame since the last boxes
+                self._frames_since_detection += 1
         except Exception as e:
             print(f"YOLO Detection error: {e}")
 
         return frame
 
     def handle_key(self, key: int) -> bool:
-        if key == ord("y"):
-            self.toggle_visibility()
-            print(f"YOLO Detection: {'ENABLED' if self.visible else 'DISABLED'}")
-            return True
-        elif key == ord("v"):
-            if self.show_segmentation and self.show_boxes:
-                self.show_segmentation = False
-                self.show_boxes = True
-                print("YOLO: Bounding boxes only")
-            elif not self.show_segmentation and self.show_boxes:
-                self.show_segmentation = True
-                self.show_boxes = False
-                print("YOLO: Segmentation only")
-            elif self.show_segmentation and not self.show_boxes:
-                self.show_segmentation = True
-                self.show_boxes = True
-                print("YOLO: Both segmentation and boxes")
-            else:
-                self.show_segmentation = False
-                self.show_boxes = True
-                print("YOLO: Bounding boxes only")
-            return True
-        return False
+        handler = self._key_handlers.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+    def _toggle_detection(self):
+        self.toggle_visibility()
+        print(f"YOLO Detection: {'ENABLED' if self.visible else 'DISABLED'}")
+
+    def _cycle_display_mode(self):
+        if self.show_segmentation and self.show_boxes:
+            self.show_segmentation = False
+            self.show_boxes = True
+            print("YOLO: Bounding boxes only")
+        elif not self.show_segmentation and self.show_boxes:
+            self.show_segmentation = True
+            self.show_boxes = False
+            print("YOLO: Segmentation only")
+        elif self.show_segmentation and not self.show_boxes:
+            self.show_segmentation = True
+            self.show_boxes = True
+            print("YOLO: Both segmentation and boxes")
+        else:
+            self.show_segmentation = False
+            self.show_boxes = True
+            print("YOLO: Bounding boxes only")
 
     def cleanup(self):
+        self._stop_worker()
         if self.model is not None:
             del self.model
             self.model = None
-        self.tracked_identities.clear()
@@ -16,9 +16,11 @@ Display Modes:
 
 import logging
 import os
+import select
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 import cv2
 
@@ -28,6 +30,8 @@ from common.config_loader import create_plugin_config, load_config
 from common.input_manager import InputManager
 from common.plugin_base import HUDContext
 from core.camera_controller import CameraController
+from core.display_thread import NO_KEY, DisplayThread, poll_window_key
+from core.frame_grabber import FrameGrabber
 from core.tak_client import TAKClient
 
 from hud.plugin_manager import PluginManager
@@ -35,41 +39,58 @@ from hud.plugin_manager import PluginManager
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+_KEY_Q = ord("q")
+_KEY_H = ord("h")
+
 
 class WarlockApplication:
     """WARLOCK application."""
 
     DEFAULT_FRAME_WIDTH = 1280
     DEFAULT_FRAME_HEIGHT = 720
+    RESERVED_CORES = 2
+    PLUGIN_CACHE_FILE = ".plugin_cache.json"
+    FRAME_TIMEOUT = 1.0
+    WINDOW_NAME = "WARLOCK"
 
-    def __init__(self, config_path: str = None, use_drm: bool = False):
+    def __init__(self, config_path: str = None, use_drm: bool = False, force_refresh: bool = False):
         """Initialize WARLOCK application.
 
         Args:
             config_path: Path to config.yaml
             use_drm: Use DRM/KMS display (headless) instead of X11/cv2.imshow
+            force_refresh: Rescan every plugin module instead of trusting the discovery cache
         """
         self.config_path = config_path or str(Path(__file__).parent / "config.yaml")
         self.use_drm = use_drm
+        self.force_refresh = force_refresh
 
         self.context = None
         self.plugin_manager = None
         self.camera = None
+        self.frame_grabber = None
         self.input_manager = None
 
         self.display = None
+        self.display_thread = None
         self.keyboard = None
+        self._key_poll = None
         self.tak_client = None
+        self._last_tak_fix: Optional[tuple] = None
 
         self.show_help = False
         self.running = False
 
+        self._key_handlers = {_KEY_Q: self._on_quit, _KEY_H: self._on_toggle_help}
+
     def initialize(self):
         """Initialize all WARLOCK components."""
         logger.info("=" * 60)
         logger.info("WARLOCK")
         logger.info("=" * 60)
 
+        self._configure_threading()
+
         logger.info("Loading configuration...")
         config = load_config(self.config_path)
 
@@ -80,15 +101,20 @@ class WarlockApplication:
         self.plugin_manager = PluginManager(self.context, plugin_dir=plugin_dir)
         self.context.state["plugin_manager"] = self.plugin_manager
 
+        plugin_configs, visibility_map = self._prepare_plugin_configs(config)
+
         logger.info("Discovering plugins...")
-        self.plugin_manager.discover_plugins()
+        self.plugin_manager.discover_plugins(
+            cache_path=script_dir / self.PLUGIN_CACHE_FILE,
+            names=[name for name, _ in plugin_configs],
+            force_refresh=self.force_refresh,
+        )
 
         logger.info("Initializing input system...")
         self.input_manager = self._initialize_input_manager(config)
         self.context.state["input_manager"] = self.input_manager
 
         logger.info("Loading plugins...")
-        plugin_configs, visibility_map = self._prepare_plugin_configs(config)
 
         try:
             loaded_plugins = self.plugin_manager.load_plugins_with_dependencies(plugin_configs)
@@ -112,6 +138,7 @@ class WarlockApplication:
 
         self.camera = CameraController(cap)
         self.context.state["camera_handle"] = self.camera
+        self.frame_grabber = FrameGrabber(self.camera)
 
         if self.use_drm:
             logger.info("Initializing DRM/KMS display (headless mode)...")
@@ -121,6 +148,8 @@ class WarlockApplication:
 
                 self.display = DRMDisplay(self.DEFAULT_FRAME_WIDTH, self.DEFAULT_FRAME_HEIGHT)
                 self.keyboard = EvdevKeyboard(auto_grab=True)
+                self._key_poll = select.epoll()
+                self._key_poll.register(self.keyboard.fileno(), select.EPOLLIN)
                 logger.info("DRM display mode active")
             except Exception as e:
                 logger.error(f"Failed to initialize DRM display: {e}")
@@ -129,12 +158,25 @@ class WarlockApplication:
         else:
             logger.info("Using X11 display mode (cv2.imshow)")
 
+        if not self.use_drm and config.get("display", {}).get("threaded", False):
+            if DisplayThread.is_supported():
+                self.display_thread = DisplayThread(self.WINDOW_NAME)
+            else:
+                logger.info("HighGUI must stay on the main thread with this backend, ignoring display.threaded")
+
         self._initialize_tak_client(config)
 
         logger.info("=" * 60)
         logger.info("WARLOCK ACTIVE - Press 'H' for help, 'Q' to quit")
         logger.info("=" * 60)
 
+    def _configure_threading(self):
+        """Enable OpenCV's optimized paths and keep its thread pool from oversubscribing small CPUs."""
+        cv2.setUseOptimized(True)
+        num_threads = max(1, (os.cpu_count() or 1) - self.RESERVED_CORES)
+        cv2.setNumThreads(num_threads)
+        logger.info(f"OpenCV threads: {num_threads} (optimized: {cv2.useOptimized()})")
+
     def _initialize_tak_client(self, config: dict):
         """Initialize TAK server connection for blue-force tracking and POI display."""
         tak_config = config.get("tak", {})
@@ -191,8 +233,21 @@ class WarlockApplication:
             input_manager.register_keybind(system_binds.get("help", "h"), "Toggle help", "system")
             input_manager.register_keybind(system_binds.get("plugin_panel", "p"), "Plugin control panel", "system")
 
+            # Resolve configured keys to key codes once so per-frame dispatch is a plain dict lookup
+            self._key_handlers = {
+                self._resolve_key_code(system_binds.get("quit"), _KEY_Q): self._on_quit,
+                self._resolve_key_code(system_binds.get("help"), _KEY_H): self._on_toggle_help,
+            }
+
         return input_manager
 
+    @staticmethod
+    def _resolve_key_code(key: Optional[str], default: int) -> int:
+        """Return the key code for a single-character keybind, or the default for anything else."""
+        if isinstance(key, str) and len(key) == 1:
+            return ord(key)
+        return default
+
     def _prepare_plugin_configs(self, config: dict) -> tuple:
         """Prepare plugin configurations from config file."""
         plugin_configs = []
@@ -214,27 +269,22 @@ class WarlockApplication:
         for plugin in loaded_plugins:
             plugin_name = plugin.__class__.__name__
             if plugin_name in visibility_map:
-                plugin.visible = visibility_map[plugin_name]
+                self.plugin_manager.set_plugin_visibility(plugin, visibility_map[plugin_name])
 
     def run(self):
         """Main application loop."""
         self.running = True
+        self.frame_grabber.start()
+        if self.display_thread:
+            self.display_thread.start()
 
         while self.running:
-            ret, frame = self.camera.read_frame()
-            if not ret:
+            frame = self._next_frame()
+            if frame is None:
                 logger.error("Failed to grab frame")
                 break
 
-            if self.tak_client and self.tak_client.connected:
-                pos = self.context.state.get("player_position", {})
-                if pos:
-                    self.tak_client.update_position(
-                        latitude=pos.get("latitude", 0.0),
-                        longitude=pos.get("longitude", 0.0),
-                        altitude=pos.get("altitude", 0.0),
-                        heading=pos.get("heading", 0.0),
-                    )
+            self._update_tak_position()
 
             try:
                 self.plugin_manager.update()
@@ -246,32 +296,78 @@ class WarlockApplication:
             except Exception as e:
                 logger.error(f"Plugin render error: {e}", exc_info=True)
 
-            if self.use_drm:
-                self.display.show(frame)
-            else:
-                cv2.imshow("WARLOCK", frame)
-
-            if self.use_drm:
-                key = self.keyboard.read_key(timeout=0.001)
-                if key is None:
-                    key = 0xFF
-            else:
-                key = cv2.waitKey(1) & 0xFF
-
-            key_handled = self.plugin_manager.handle_key(key)
+            if not self._show_frame(frame):
+                break
 
-            if not key_handled:
+            # Most frames have no key press; don't walk every plugin's handle_key just to reject it
+            key = self._poll_key()
+            if key != NO_KEY and not self.plugin_manager.handle_key(key):
                 self._handle_key(key)
 
         logger.info("Shutting down...")
 
+    def _next_frame(self):
+        """Wait for the newest camera frame; None once the grabber has stopped."""
+        while True:
+            frame = self.frame_grabber.get_latest(timeout=self.FRAME_TIMEOUT)
+            if frame is not None or not self.frame_grabber.is_alive():
+                return frame
+
+    def _update_tak_position(self):
+        if not (self.tak_client and self.tak_client.connected):
+            return
+
+        pos = self.context.state.get("player_position", {})
+        if not pos:
+            return
+
+        fix = (
+            pos.get("latitude", 0.0),
+            pos.get("longitude", 0.0),
+            pos.get("altitude", 0.0),
+            pos.get("heading", 0.0),
+        )
+        # The client keeps the last snapshot for its send thread; only replace it when something moved
+        if fix != self._last_tak_fix:
+            self._last_tak_fix = fix
+            latitude, longitude, altitude, heading = fix
+            self.tak_client.update_position(latitude=latitude, longitude=longitude, altitude=altitude, heading=heading)
+
+    def _show_frame(self, frame) -> bool:
+        """Send the frame to whichever display is active; False if the display thread has died."""
+        if self.use_drm:
+            self.display.show(frame)
+        elif self.display_thread:
+            if not self.display_thread.is_alive():
+                logger.error("Display thread stopped")
+                return False
+            self.display_thread.submit(frame)
+        else:
+            cv2.imshow(self.WINDOW_NAME, frame)
+        return True
+
+    def _poll_key(self) -> int:
+        """Return the pending key press without blocking, or NO_KEY."""
+        if self.use_drm:
+            # Zero-timeout poll: only touch the device when a key event is pending
+            key = self.keyboard.read_key_nonblocking() if self._key_poll.poll(0) else None
+            return NO_KEY if key is None else key
+        if self.display_thread:
+            return self.display_thread.poll_key()
+        return poll_window_key()
+
     def _handle_key(self, key: int):
         """Handle keyboard input."""
-        if key == ord("q"):
-            self.running = False
-        elif key == ord("h"):
-            self.show_help = not self.show_help
-            logger.info(f"Help overlay: {'ON' if self.show_help else 'OFF'}")
+        handler = self._key_handlers.get(key)
+        if handler is not None:
+            handler()
+
+    def _on_quit(self):
+        self.running = False
+
+    def _on_toggle_help(self):
+        self.show_help = not self.show_help
+        logger.info(f"Help overlay: {'ON' if self.show_help else 'OFF'}")
 
     def cleanup(self):
         """Cleanup resources."""
@@ -283,14 +379,21 @@ class WarlockApplication:
         if self.plugin_manager:
             self.plugin_manager.cleanup()
 
+        if self.frame_grabber:
+            self.frame_grabber.stop()
+
         if self.camera:
             self.camera.release()
 
         if self.use_drm:
             if self.display:
                 self.display.cleanup()
+            if self._key_poll:
+                self._key_poll.close()
             if self.keyboard:
                 self.keyboard.cleanup()
+        elif self.display_thread:
+            self.display_thread.stop()
         else:
             cv2.destroyAllWindows()
 
@@ -308,6 +411,9 @@ def main():
     parser.add_argument(
         "--use-drm", action="store_true", help="Use DRM/KMS display (headless mode) instead of X11/cv2.imshow"
     )
+    parser.add_argument(
+        "--force-refresh", action="store_true", help="Rescan all plugin modules instead of using the discovery cache"
+    )
     args = parser.parse_args()
 
     use_drm = args.use_drm or os.environ.get("WARLOCK_USE_DRM", "0") == "1"
@@ -315,7 +421,7 @@ def main():
     if use_drm:
         logger.info("DRM mode requested - will run in headless mode")
 
-    app = WarlockApplication(config_path=args.config, use_drm=use_drm)
+    app = WarlockApplication(config_path=args.config, use_drm=use_drm, force_refresh=args.force_refresh)
 
     try:
         app.initialize()
@@ -0,0 +1,20 @@
+"""Shared fixtures for the HUD test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.plugin_base import HUDContext
+
+from hud.plugin_manager import PluginManager
+
+_PLUGIN_DIR = Path(__file__).resolve().parent.parent / "hud" / "plugins"
+
+
+@pytest.fixture(scope="session")
+def discovered_plugins():
+    """Walk and import hud/plugins once per session; tests that need a manager copy the result into their own."""
+    return PluginManager(HUDContext(1280, 720), plugin_dir=str(_PLUGIN_DIR)).discover_plugins()
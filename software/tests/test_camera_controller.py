@@ -0,0 +1,91 @@
+"""Tests for CameraController property access while a frame read is in flight."""
+
+import sys
+import threading
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.camera_controller import CameraController
+
+_READ_TIMEOUT = 2.0
+
+
+class _SlowCapture:
+    """Stand-in VideoCapture whose read() blocks until the test lets it finish."""
+
+    def __init__(self):
+        self.read_started = threading.Event()
+        self.finish_read = threading.Event()
+        self.reading = False
+        self.properties = {}
+        self.set_calls = []
+        self.accept_sets = True
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        self.reading = True
+        self.read_started.set()
+        self.finish_read.wait(_READ_TIMEOUT)
+        self.reading = False
+        return True, np.zeros((4, 4, 3), dtype=np.uint8)
+
+    def set(self, prop_id, value):
+        self.set_calls.append((prop_id, value, self.reading))
+        if not self.accept_sets:
+            return False
+        self.properties[prop_id] = value
+        return True
+
+    def get(self, prop_id):
+        return self.properties.get(prop_id, -1)
+
+    def release(self):
+        pass
+
+
+class TestPropertiesDuringRead:
+    """Setters on the render thread must not wait for the grabber thread's blocking read."""
+
+    def setup_method(self):
+        self.capture = _SlowCapture()
+        self.camera = CameraController(self.capture)
+        self.reader = threading.Thread(target=self.camera.read_frame_into, args=(None,))
+        self.reader.start()
+        assert self.capture.read_started.wait(_READ_TIMEOUT)
+
+    def teardown_method(self):
+        self.capture.finish_read.set()
+        self.reader.join(_READ_TIMEOUT)
+
+    def test_setter_returns_while_read_in_progress(self):
+        """set_exposure should return before the in-flight read finishes."""
+        assert self.camera.set_exposure(-5)
+
+        assert self.capture.reading, "Setter must not have waited for the read to finish"
+        assert self.camera.get_exposure() == -5
+
+    def test_queued_setting_applied_after_read(self):
+        """A value set mid-read reaches the capture once read() returns, never during it."""
+        self.camera.set_gain(40)
+
+        self.capture.finish_read.set()
+        self.reader.join(_READ_TIMEOUT)
+
+        assert self.capture.set_calls == [(cv2.CAP_PROP_GAIN, 40, False)]
+
+    def test_rejected_queued_setting_is_logged(self, caplog):
+        """A queued change the camera refuses once applied should not fail silently."""
+        self.capture.accept_sets = False
+        assert self.camera.set_gain(40), "Queued changes report success before they are applied"
+
+        self.capture.finish_read.set()
+        self.reader.join(_READ_TIMEOUT)
+
+        assert "rejected deferred property" in caplog.text
+        assert self.camera.get_gain() is None
@@ -13,6 +13,7 @@ from common.data_models import (
     ThermalStatus,
     ThermalStatusLevel,
     WiFiDetection,
+    YOLODetection,
 )
 
 
@@ -43,6 +44,14 @@ class TestDataModelCreation:
         assert det.class_name == "person"
         assert 0.0 <= det.confidence <= 1.0
 
+    def test_yolo_detection_can_be_created(self):
+        """YOLODetection is published every frame, so it is slotted rather than dict-backed."""
+        det = YOLODetection(bbox=(100, 200, 150, 300), track_id=7, confidence=0.8, identity="FRIEND")
+
+        assert det.track_id == 7
+        assert not det.has_mask
+        assert not hasattr(det, "__dict__")
+
     def test_friendly_unit_can_be_created(self):
         """FriendlyUnit represents team members."""
         unit = FriendlyUnit(
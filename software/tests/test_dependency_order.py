@@ -8,12 +8,13 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.plugin_base import HUDContext
-from helmet.hud.plugin_manager import PluginManager
+
+from hud.plugin_manager import PluginManager
 
 
 def test_dependency_order():
     context = HUDContext(1280, 720)
-    plugin_manager = PluginManager(context, plugin_dir=str(Path(__file__).parent.parent / "helmet" / "hud" / "plugins"))
+    plugin_manager = PluginManager(context, plugin_dir=str(Path(__file__).parent.parent / "hud" / "plugins"))
 
     plugin_manager.discover_plugins()
 
@@ -37,7 +38,7 @@ def test_render_order_by_z_index():
     from common.plugin_base import PluginConfig
 
     context = HUDContext(1280, 720)
-    plugin_manager = PluginManager(context, plugin_dir=str(Path(__file__).parent.parent / "helmet" / "hud" / "plugins"))
+    plugin_manager = PluginManager(context, plugin_dir=str(Path(__file__).parent.parent / "hud" / "plugins"))
 
     plugin_manager.discover_plugins()
 
@@ -48,14 +48,14 @@ class TestConsumerPlugin(HUDPlugin):
 
 
 if __name__ == "__main__":
-    from helmet.hud.plugin_manager import PluginManager
+    from hud.plugin_manager import PluginManager
 
     print("=" * 60)
     print("Testing HARD Dependency with Topological Sort")
     print("=" * 60)
 
     context = HUDContext(1280, 720)
-    pm = PluginManager(context, plugin_dir=str(Path(__file__).parent.parent / "helmet" / "hud" / "plugins"))
+    pm = PluginManager(context, plugin_dir=str(Path(__file__).parent.parent / "hud" / "plugins"))
 
     pm.discover_plugins()
 
@@ -68,7 +68,8 @@ if __name__ == "__main__":
         correct_order = pm.topological_sort_plugins(wrong_order)
         print(f"   Corrected order:         {' → '.join(correct_order)}")
 
-        if correct_order.index("BorderPaddingPlugin") < correct_order.index("TestConsumerPlugin"):
+        idx = {name: i for i, name in enumerate(correct_order)}
+        if idx["BorderPaddingPlugin"] < idx["TestConsumerPlugin"]:
             print("   ✓ Dependencies loaded first!")
         else:
             print("   ✗ ERROR: Dependency order wrong!")
@@ -8,7 +8,37 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.config_loader import create_plugin_config, load_config
 from common.plugin_base import HUDContext
-from helmet.hud.plugin_manager import PluginManager
+from tests.fixtures.mock_plugins import IndependentPlugin, ProviderPlugin
+
+from hud.plugin_manager import PluginManager
+
+_SOFTWARE_DIR = Path(__file__).resolve().parent.parent
+_PLUGIN_DIR = _SOFTWARE_DIR / "hud" / "plugins"
+_CONFIG_PATH = _SOFTWARE_DIR / "config.yaml"
+
+# Read-only so a test that needs to draw must take its own copy
+_BLANK_FRAME = np.zeros((720, 1280, 3), dtype=np.uint8)
+_BLANK_FRAME.setflags(write=False)
+
+
+class _LowZPlugin(IndependentPlugin):
+    def __init__(self, context, config):
+        super().__init__(context, config)
+        self.metadata.name = "LowZ"
+
+    def render(self, frame):
+        frame[0, 0] = [1, 0, 0]
+        return frame
+
+
+class _HighZPlugin(IndependentPlugin):
+    def __init__(self, context, config):
+        super().__init__(context, config)
+        self.metadata.name = "HighZ"
+
+    def render(self, frame):
+        frame[0, 0] = [2, 0, 0]
+        return frame
 
 
 class TestPluginSystemIntegration:
@@ -16,27 +46,40 @@ class TestPluginSystemIntegration:
 
     def setup_method(self):
         self.context = HUDContext(1280, 720)
-        self.manager = PluginManager(self.context, plugin_dir="helmet/hud/plugins")
+        self.manager = PluginManager(self.context, plugin_dir=str(_PLUGIN_DIR))
 
-    def test_can_discover_all_plugins(self):
+    def test_can_discover_all_plugins(self, discovered_plugins):
         """Plugin discovery should find all plugin files."""
-        discovered = self.manager.discover_plugins()
-
-        assert len(discovered) > 0, "Should discover at least one plugin"
-        for name, plugin_class in discovered.items():
+        assert len(discovered_plugins) > 0, "Should discover at least one plugin"
+        for name, plugin_class in discovered_plugins.items():
             from common.plugin_base import HUDPlugin
 
             assert issubclass(plugin_class, HUDPlugin), f"{name} must be a subclass of HUDPlugin"
 
-    def test_can_load_all_configured_plugins(self):
+    def test_cached_discovery_matches_full_scan(self, tmp_path):
+        """A warm discovery cache must register the same classes, and so sort the same way, as a full scan."""
+        # BorderPaddingPlugin is left out so a provider that is not configured would skew inference
+        names = ["CompassPlugin", "TAKOverlayPlugin", "FPSCounterPlugin", "PluginControlPanel"]
+        cache_path = tmp_path / "plugin_cache.json"
+
+        cold = PluginManager(self.context, plugin_dir=str(_PLUGIN_DIR))
+        cold.discover_plugins(cache_path=cache_path, names=names)
+        assert cache_path.exists()
+
+        warm = PluginManager(self.context, plugin_dir=str(_PLUGIN_DIR))
+        warm.discover_plugins(cache_path=cache_path, names=names)
+
+        assert warm.plugin_classes == cold.plugin_classes
+        assert warm.topological_sort_plugins(names) == cold.topological_sort_plugins(names)
+
+    def test_can_load_all_configured_plugins(self, discovered_plugins):
         """All enabled plugins in config should load successfully."""
-        self.manager.discover_plugins()
+        self.manager.plugin_classes = dict(discovered_plugins)
 
-        config_path = Path("helmet/helmet_config.yaml")
-        if not config_path.exists():
-            pytest.skip("helmet/helmet_config.yaml not found")
+        if not _CONFIG_PATH.exists():
+            pytest.skip("config.yaml not found")
 
-        config = load_config(str(config_path))
+        config = load_config(str(_CONFIG_PATH))
 
         plugin_configs = []
         for plugin_data in config.get("plugins", []):
@@ -52,14 +95,13 @@ class TestPluginSystemIntegration:
         except ValueError as e:
             pytest.fail(f"Failed to load plugins due to circular dependency: {e}")
 
-    def test_render_pipeline_completes(self):
+    def test_render_pipeline_completes(self, discovered_plugins):
         """Basic render pipeline should complete without crashing."""
-        self.manager.discover_plugins()
-
-        from tests.fixtures.mock_plugins import IndependentPlugin, ProviderPlugin
-
-        self.manager.plugin_classes["ProviderPlugin"] = ProviderPlugin
-        self.manager.plugin_classes["IndependentPlugin"] = IndependentPlugin
+        self.manager.plugin_classes = {
+            **discovered_plugins,
+            "ProviderPlugin": ProviderPlugin,
+            "IndependentPlugin": IndependentPlugin,
+        }
 
         configs = [
             ("ProviderPlugin", create_plugin_config({"z_index": 1})),
@@ -68,7 +110,7 @@ class TestPluginSystemIntegration:
 
         loaded = self.manager.load_plugins_with_dependencies(configs)
 
-        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        frame = _BLANK_FRAME
 
         self.manager.update()
 
@@ -79,35 +121,15 @@ class TestPluginSystemIntegration:
 
     def test_plugins_render_in_z_index_order(self):
         """Plugins should render in z-index order, not load order."""
-        from tests.fixtures.mock_plugins import IndependentPlugin
-
-        class LowZPlugin(IndependentPlugin):
-            def __init__(self, context, config):
-                super().__init__(context, config)
-                self.metadata.name = "LowZ"
-
-            def render(self, frame):
-                frame[0, 0] = [1, 0, 0]
-                return frame
-
-        class HighZPlugin(IndependentPlugin):
-            def __init__(self, context, config):
-                super().__init__(context, config)
-                self.metadata.name = "HighZ"
-
-            def render(self, frame):
-                frame[0, 0] = [2, 0, 0]
-                return frame
-
-        self.manager.plugin_classes = {"LowZPlugin": LowZPlugin, "HighZPlugin": HighZPlugin}
+        self.manager.plugin_classes = {"LowZPlugin": _LowZPlugin, "HighZPlugin": _HighZPlugin}
 
         low_config = create_plugin_config({"z_index": 1})
         high_config = create_plugin_config({"z_index": 10})
 
-        self.manager.load_plugin(HighZPlugin, high_config)
-        self.manager.load_plugin(LowZPlugin, low_config)
+        self.manager.load_plugin(_HighZPlugin, high_config)
+        self.manager.load_plugin(_LowZPlugin, low_config)
 
-        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        frame = _BLANK_FRAME.copy()
         result = self.manager.render(frame)
 
         assert result[0, 0, 0] == 2, "HighZ plugin should render last (overwriting LowZ)"
@@ -139,17 +161,30 @@ class TestEventSystem:
 
         assert len(self.context.events) == 0
 
+    def test_clear_events_batch(self):
+        """A full frame's worth of events should clear in place."""
+        payload = {"key": "value"}
+        events = self.context.events
+        for _ in range(self.context.MAX_EVENTS):
+            self.context.emit_event("test_event", payload)
+
+        assert len(events) == self.context.MAX_EVENTS
+
+        self.context.clear_events()
+
+        assert self.context.events is events, "Listeners holding the event buffer must see the clear"
+        assert len(events) == 0
+
 
 class TestConfigLoading:
     """Test configuration loading and validation."""
 
     def test_can_load_valid_config(self):
         """Should load valid YAML config without errors."""
-        config_path = Path("helmet/helmet_config.yaml")
-        if not config_path.exists():
-            pytest.skip("helmet/helmet_config.yaml not found")
+        if not _CONFIG_PATH.exists():
+            pytest.skip("config.yaml not found")
 
-        config = load_config(str(config_path))
+        config = load_config(str(_CONFIG_PATH))
 
         assert "plugins" in config
         assert isinstance(config["plugins"], list)
@@ -9,43 +9,40 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "software"))
 
 from common.plugin_base import HUDContext, HUDPlugin, PluginConfig
-from helmet.hud.plugin_manager import PluginManager
 from tests.fixtures.mock_plugins import ProviderPlugin
 
+from hud.plugin_manager import PluginManager
+
 
 class TestPluginInterface:
     """Test that plugins follow the HUDPlugin interface contract."""
 
     def setup_method(self):
         self.context = HUDContext(1280, 720)
-        self.manager = PluginManager(self.context, plugin_dir="helmet/hud/plugins")
 
-    def test_all_plugins_implement_required_methods(self):
+    def test_all_plugins_implement_required_methods(self, discovered_plugins):
         """Every plugin must implement abstract methods."""
-        self.manager.discover_plugins()
-
         required_methods = ["initialize", "update", "render"]
 
-        for name, plugin_class in self.manager.plugin_classes.items():
+        for name, plugin_class in discovered_plugins.items():
             for method_name in required_methods:
                 assert hasattr(plugin_class, method_name), f"{name} must implement {method_name}()"
 
                 method = getattr(plugin_class, method_name)
                 assert callable(method), f"{name}.{method_name} must be callable"
 
-    def test_all_plugins_have_metadata(self):
+    def test_all_plugins_have_metadata(self, discovered_plugins):
         """Every plugin must have metadata with required fields."""
-        self.manager.discover_plugins()
-
         required_fields = ["name", "version", "author", "description"]
 
-        for name, plugin_class in self.manager.plugin_classes.items():
-            plugin = plugin_class(self.context, PluginConfig())
+        for name, plugin_class in discovered_plugins.items():
+            # METADATA is class-level, so there is no need to construct plugins (some load models or open files)
+            metadata = getattr(plugin_class, "METADATA", None)
 
-            assert hasattr(plugin, "metadata"), f"{name} must have metadata"
+            assert metadata is not None, f"{name} must have metadata"
 
             for field in required_fields:
-                assert hasattr(plugin.metadata, field), f"{name}.metadata must have {field}"
+                assert hasattr(metadata, field), f"{name}.metadata must have {field}"
 
     def test_plugin_initialize_returns_bool(self):
         """initialize() must return boolean."""
@@ -73,7 +70,6 @@ class TestPluginDataContract:
 
     def setup_method(self):
         self.context = HUDContext(1280, 720)
-        self.manager = PluginManager(self.context, plugin_dir="helmet/hud/plugins")
 
     def test_provides_documented_in_metadata(self):
         """Plugins using provide_data() should declare what they provide."""
@@ -82,11 +78,10 @@ class TestPluginDataContract:
         plugin.initialize()
 
         provided_keys = set(self.context.state.keys())
+        declared_keys = ProviderPlugin.METADATA.provides
 
         for key in provided_keys:
-            assert (
-                key in plugin.metadata.provides
-            ), f"Plugin provides '{key}' but doesn't declare it in metadata.provides"
+            assert key in declared_keys, f"Plugin provides '{key}' but doesn't declare it in metadata.provides"
 
     def test_require_data_raises_on_missing(self):
         """require_data() must raise RuntimeError when data missing."""